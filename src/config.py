@@ -19,24 +19,29 @@ load_dotenv()
 def _cast(value: str, caster: Callable[[str], object], name: str) -> object:
     try:
         return caster(value)
-    except Exception as exc:  # pragma: no cover - branch exercised via ValueError path
+    except (ValueError, TypeError) as exc:
         msg = f"Environment variable {name} is invalid: {exc}"
         raise ValueError(msg) from exc
 
 
 def _require_env(required: dict[str, Callable[[str], object]]) -> dict[str, object]:
-    missing = [key for key in required if not os.getenv(key)]
+    env = os.environ
+    raw_values: dict[str, str] = {}
+    missing: list[str] = []
+    for key in required:
+        raw = env.get(key)
+        if raw:
+            raw_values[key] = raw
+        else:
+            missing.append(key)
     if missing:
         missing_str = ", ".join(missing)
         msg = f"Missing required environment variables: {missing_str}"
         raise ValueError(msg)
 
-    values: dict[str, object] = {}
-    for key, caster in required.items():
-        raw = os.getenv(key)
-        assert raw is not None  # for type checkers; guarded by missing check above
-        values[key] = _cast(raw, caster, key)
-    return values
+    return {
+        key: _cast(raw_values[key], caster, key) for key, caster in required.items()
+    }
 
 
 def _optional_int_env(name: str, default: int | None) -> int | None:
@@ -48,6 +53,19 @@ def _optional_int_env(name: str, default: int | None) -> int | None:
     return value
 
 
+def _optional_str_env(name: str) -> str | None:
+    return os.getenv(name) or None
+
+
+def _optional_float_env(name: str, default: float) -> float:
+    raw = os.getenv(name)
+    if raw is None:
+        return default
+    value = _cast(raw, float, name)
+    assert isinstance(value, float)
+    return value
+
+
 _REQUIRED_VARS: dict[str, Callable[[str], object]] = {
     "OPENAI_MODEL": str,
     "TEMPERATURE": float,
@@ -72,9 +90,13 @@ TRANSLATION_MAX_RETRIES: int = _env_values["TRANSLATION_MAX_RETRIES"]  # type: i
 TRANSLATION_RETRY_BACKOFF_SECONDS: float = _env_values[
     "TRANSLATION_RETRY_BACKOFF_SECONDS"
 ]  # type: ignore[assignment]
+TRANSLATION_RETRY_BACKOFF_MAX_SECONDS = _optional_float_env(
+    "TRANSLATION_RETRY_BACKOFF_MAX_SECONDS", 60.0
+)
 _raw_max_workers = _env_values["TRANSLATION_MAX_WORKERS"]
 assert isinstance(_raw_max_workers, int)
-TRANSLATION_MAX_WORKERS: int = max(1, min(10, _raw_max_workers))
+# No upper clamp: throughput is bounded by the optional RPM/TPM limiter instead
+TRANSLATION_MAX_WORKERS: int = max(1, _raw_max_workers)
 
 _MODEL_TOKEN_LIMITS: dict[str, tuple[int, int]] = {
     "gpt-5-mini": (400_000, 128_000),
@@ -88,6 +110,15 @@ MODEL_MAX_OUTPUT_TOKENS = _optional_int_env(
     "MODEL_MAX_OUTPUT_TOKENS", _default_max_output
 )
 
+TRANSLATION_MAX_REQUESTS_PER_MINUTE = _optional_int_env(
+    "TRANSLATION_MAX_REQUESTS_PER_MINUTE", None
+)
+TRANSLATION_MAX_TOKENS_PER_MINUTE = _optional_int_env(
+    "TRANSLATION_MAX_TOKENS_PER_MINUTE", None
+)
+
+TRANSLATION_CACHE_FILE = _optional_str_env("TRANSLATION_CACHE_FILE")
+
 __all__: tuple[str, ...] = (
     "GLOSSARY_FILE",
     "INPUT_FILE",
@@ -97,7 +128,11 @@ __all__: tuple[str, ...] = (
     "OPENAI_MODEL",
     "OUTPUT_FILE",
     "TEMPERATURE",
+    "TRANSLATION_CACHE_FILE",
+    "TRANSLATION_MAX_REQUESTS_PER_MINUTE",
     "TRANSLATION_MAX_RETRIES",
+    "TRANSLATION_MAX_TOKENS_PER_MINUTE",
     "TRANSLATION_MAX_WORKERS",
+    "TRANSLATION_RETRY_BACKOFF_MAX_SECONDS",
     "TRANSLATION_RETRY_BACKOFF_SECONDS",
 )
@@ -0,0 +1,109 @@
+"""Token-bucket throttling for OpenAI request and token rate limits."""
+
+from __future__ import annotations
+
+import threading
+import time
+
+
+def _positive_or_none(limit: int | None) -> int | None:
+    return limit if limit is not None and limit > 0 else None
+
+
+class RateLimiter:
+    """Thread-safe token bucket gating requests-per-minute and tokens-per-minute.
+
+    Capacity refills continuously at ``limit / 60`` per second and is capped at
+    one minute's worth, so bursts never exceed the configured ceiling. A limit
+    of ``None`` disables that bucket; with both disabled ``acquire`` is a no-op.
+    """
+
+    SECONDS_PER_MINUTE = 60.0
+
+    def __init__(
+        self,
+        max_requests_per_minute: int | None = None,
+        max_tokens_per_minute: int | None = None,
+    ) -> None:
+        """Initialize buckets at full capacity.
+
+        Args:
+            max_requests_per_minute: Request ceiling (None or <= 0 disables).
+            max_tokens_per_minute: Token ceiling (None or <= 0 disables).
+        """
+        self.max_requests_per_minute: int | None = _positive_or_none(
+            max_requests_per_minute
+        )
+        self.max_tokens_per_minute: int | None = _positive_or_none(
+            max_tokens_per_minute
+        )
+        self.available_request_capacity: float = float(
+            self.max_requests_per_minute or 0
+        )
+        self.available_token_capacity: float = float(self.max_tokens_per_minute or 0)
+        self._last_refill: float = time.monotonic()
+        self._lock = threading.Lock()
+
+    @property
+    def enabled(self) -> bool:
+        """Return True when at least one limit is configured."""
+        return (
+            self.max_requests_per_minute is not None
+            or self.max_tokens_per_minute is not None
+        )
+
+    def _refill(self, now: float) -> None:
+        elapsed = now - self._last_refill
+        self._last_refill = now
+        if self.max_requests_per_minute is not None:
+            self.available_request_capacity = min(
+                float(self.max_requests_per_minute),
+                self.available_request_capacity
+                + elapsed * self.max_requests_per_minute / self.SECONDS_PER_MINUTE,
+            )
+        if self.max_tokens_per_minute is not None:
+            self.available_token_capacity = min(
+                float(self.max_tokens_per_minute),
+                self.available_token_capacity
+                + elapsed * self.max_tokens_per_minute / self.SECONDS_PER_MINUTE,
+            )
+
+    def _wait_seconds(self, tokens: int) -> float:
+        """Return how long to wait until both buckets can cover the request."""
+        wait = 0.0
+        if self.max_requests_per_minute is not None:
+            deficit = 1.0 - self.available_request_capacity
+            if deficit > 0:
+                rate = self.max_requests_per_minute / self.SECONDS_PER_MINUTE
+                wait = max(wait, deficit / rate)
+        if self.max_tokens_per_minute is not None:
+            deficit = tokens - self.available_token_capacity
+            if deficit > 0:
+                rate = self.max_tokens_per_minute / self.SECONDS_PER_MINUTE
+                wait = max(wait, deficit / rate)
+        return wait
+
+    def acquire(self, tokens: int = 0) -> None:
+        """Block until one request and ``tokens`` tokens are available, then
+        consume them.
+
+        Requests larger than the per-minute token ceiling are clamped to the
+        ceiling so they wait for a full bucket instead of blocking forever.
+        """
+        if not self.enabled:
+            return
+
+        if self.max_tokens_per_minute is not None:
+            tokens = min(tokens, self.max_tokens_per_minute)
+
+        while True:
+            with self._lock:
+                self._refill(time.monotonic())
+                wait = self._wait_seconds(tokens)
+                if wait <= 0:
+                    if self.max_requests_per_minute is not None:
+                        self.available_request_capacity -= 1.0
+                    if self.max_tokens_per_minute is not None:
+                        self.available_token_capacity -= tokens
+                    return
+            time.sleep(wait)
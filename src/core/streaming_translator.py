@@ -7,19 +7,21 @@ from __future__ import annotations
 
 import logging
 import math
+import random
 import time
 from collections.abc import Iterator as TypingIterator
-from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
 from dataclasses import dataclass
 from pathlib import Path
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
     from collections.abc import Iterator as ChunkIterator
+    from typing import TextIO
 else:  # pragma: no cover - alias for runtime type hints
     ChunkIterator = TypingIterator
 
-from openai import OpenAI
+from openai import APIStatusError, OpenAI
 from rich.progress import (
     BarColumn,
     MofNCompleteColumn,
@@ -33,6 +35,8 @@ from rich.progress import (
 )
 
 from src import config
+from src.core.rate_limiter import RateLimiter
+from src.core.translation_cache import TranslationCache
 from src.core.translation_config import TranslationConfig
 from src.utils.output_formatter import OutputFormatter
 from src.utils.rich_logging import get_console
@@ -80,10 +84,17 @@ class TranslationError(Exception):
     Args:
         is_transient: True if error is retryable, False if permanent
         message: Error message (defaults based on is_transient)
+        retry_after: Server-requested wait in seconds (Retry-After), if any
     """
 
-    def __init__(self, is_transient: bool, message: str | None = None) -> None:
+    def __init__(
+        self,
+        is_transient: bool,
+        message: str | None = None,
+        retry_after: float | None = None,
+    ) -> None:
         self.is_transient = is_transient
+        self.retry_after = retry_after
         if message is None:
             message = (
                 "OpenAI API 호출 실패"
@@ -93,6 +104,58 @@ class TranslationError(Exception):
         super().__init__(message)
 
 
+def _retry_after_seconds(exc: BaseException) -> float | None:
+    """Extract the server's Retry-After hint (in seconds) from an API error."""
+    if not isinstance(exc, APIStatusError):
+        return None
+    headers = exc.response.headers
+    for header, scale in (("retry-after-ms", 1000.0), ("retry-after", 1.0)):
+        raw = headers.get(header)
+        if raw is None:
+            continue
+        try:
+            seconds = float(raw) / scale
+        except ValueError:
+            # HTTP-date form is not used by OpenAI; fall back to backoff
+            continue
+        if seconds >= 0:
+            return seconds
+    return None
+
+
+class _OrderedChunkWriter:
+    """Write chunk translations in original order as soon as they are known.
+
+    Results may be resolved in any order; each one is held only until every
+    earlier chunk has been resolved, then written and flushed so the output
+    file grows while the run is still in progress. Failed chunks (``None``)
+    are skipped. Not thread-safe: resolve from the collecting thread only.
+    """
+
+    def __init__(self, file: TextIO, chunk_indices: list[int]) -> None:
+        self._file = file
+        self._order = chunk_indices
+        self._next_position = 0
+        self._pending: dict[int, str | None] = {}
+
+    def resolve(self, chunk_index: int, translation: str | None) -> None:
+        """Record a chunk's outcome and write every chunk that is now ready."""
+        self._pending[chunk_index] = translation
+        wrote = False
+        while (
+            self._next_position < len(self._order)
+            and self._order[self._next_position] in self._pending
+        ):
+            ready = self._pending.pop(self._order[self._next_position])
+            self._next_position += 1
+            if ready:
+                # Indent while writing; one write per chunk including separator
+                self._file.write(OutputFormatter.format_text(ready) + "\n\n")
+                wrote = True
+        if wrote:
+            self._file.flush()
+
+
 class StreamingTranslator:
     """Translator for academic papers using OpenAI Chat Completions API."""
 
@@ -103,6 +166,15 @@ class StreamingTranslator:
     KOREAN_CHAR_TO_TOKEN_RATIO = 2.5
     MIN_LAST_CHUNK_RATIO = 0.7
     MIN_CHUNKS_FOR_MERGE = 2
+    # Minimum spacing of per-chunk progress updates while streaming (~20Hz)
+    PROGRESS_UPDATE_INTERVAL_SECONDS = 0.05
+    # Submitted-but-unfinished chunks allowed per worker in parallel mode
+    IN_FLIGHT_PER_WORKER = 2
+    # OpenAI applies automatic prompt caching only to prefixes of this size
+    PROMPT_CACHE_MIN_TOKENS = 1024
+    # Sanity ceiling for server Retry-After hints (separate from the backoff
+    # cap, which only bounds our own computed delays)
+    RETRY_AFTER_MAX_SECONDS = 600.0
 
     def __init__(  # noqa: PLR0913
         self,
@@ -112,22 +184,44 @@ class StreamingTranslator:
         max_retries: int = config.TRANSLATION_MAX_RETRIES,
         retry_backoff_seconds: float = config.TRANSLATION_RETRY_BACKOFF_SECONDS,
         max_workers: int = config.TRANSLATION_MAX_WORKERS,
+        *,
+        retry_backoff_max_seconds: float = (
+            config.TRANSLATION_RETRY_BACKOFF_MAX_SECONDS
+        ),
+        max_requests_per_minute: int | None = (
+            config.TRANSLATION_MAX_REQUESTS_PER_MINUTE
+        ),
+        max_tokens_per_minute: int | None = config.TRANSLATION_MAX_TOKENS_PER_MINUTE,
+        translation_cache_file: str | None = config.TRANSLATION_CACHE_FILE,
     ) -> None:
         """Initialize translator dependencies and configuration."""
         self.client: OpenAI = OpenAI()
         self.input_file: str = input_file
         self.output_file: str = output_file
+        self._input_path = Path(input_file)
+        self._output_path = Path(output_file)
         self.max_token_length: int = max_token_length
         self.max_retries: int = max(0, max_retries)
         self.retry_backoff_seconds: float = max(0.0, retry_backoff_seconds)
-        self.max_workers: int = max(1, min(10, max_workers))  # Clamp between 1 and 10
+        self.retry_backoff_max_seconds: float = max(
+            self.retry_backoff_seconds, retry_backoff_max_seconds
+        )
+        self.max_workers: int = max(1, max_workers)  # At least one worker
         self.config: TranslationConfig = TranslationConfig()
         self.token_counter: TokenCounter = TokenCounter()
+        # Shared across worker threads so parallel chunks respect one budget
+        self.rate_limiter: RateLimiter = RateLimiter(
+            max_requests_per_minute, max_tokens_per_minute
+        )
+        self._system_prompt_tokens: int | None = None
+        self.translation_cache: TranslationCache = TranslationCache(
+            translation_cache_file, self.config.model, self.config.temperature
+        )
 
     def _build_chunks(self, lines: list[str]) -> list[tuple[str, int, bool]]:
         """Build balanced chunks with token counts and oversized markers."""
         # Phase 1: Calculate total tokens and individual line tokens
-        line_tokens = [self.token_counter.count_tokens(line) for line in lines]
+        line_tokens = self.token_counter.count_tokens_batch(lines)
         total_tokens = sum(line_tokens)
 
         # Phase 2: Calculate target distribution
@@ -140,15 +234,13 @@ class StreamingTranslator:
         target_chunk_size = total_tokens / num_chunks
 
         # Phase 3: Distribute lines into balanced chunks
-        buffer = ""
+        buffer_parts: list[str] = []
         current_chunk_tokens = 0
         chunks: list[tuple[str, int, bool]] = []
 
-        for i, line in enumerate(lines):
-            line_token_count = line_tokens[i]
-
+        for line, line_token_count in zip(lines, line_tokens, strict=True):
             # Handle oversized single line (AC-6)
-            if not buffer and line_token_count > self.max_token_length:
+            if not buffer_parts and line_token_count > self.max_token_length:
                 chunk_number = len(chunks) + 1
                 logger.warning(
                     "chunk=%d single line over limit len=%d",
@@ -164,14 +256,14 @@ class StreamingTranslator:
             # Finalize chunk if:
             # 1. We have content in buffer AND
             # 2. We've reached/exceeded target OR would exceed it significantly
-            if buffer and candidate_tokens >= target_chunk_size:
+            if buffer_parts and candidate_tokens >= target_chunk_size:
                 # Only finalize if not on last chunk or significantly exceeding
                 chunks_remaining = num_chunks - len(chunks)
                 should_finalize = (
                     chunks_remaining > 1 or candidate_tokens > self.max_token_length
                 )
                 if should_finalize:
-                    chunks.append((buffer, current_chunk_tokens, False))
+                    chunks.append(("".join(buffer_parts), current_chunk_tokens, False))
 
                     # Check if the next line is oversized before buffering
                     if line_token_count > self.max_token_length:
@@ -182,29 +274,43 @@ class StreamingTranslator:
                             len(line),
                         )
                         chunks.append((line, line_token_count, True))
-                        buffer = ""
+                        buffer_parts = []
                         current_chunk_tokens = 0
                     else:
-                        buffer = line
+                        buffer_parts = [line]
                         current_chunk_tokens = line_token_count
                 else:
                     # Last chunk, accumulate remaining lines
-                    buffer += line
+                    buffer_parts.append(line)
                     current_chunk_tokens = candidate_tokens
             else:
                 # Accumulate line
-                buffer += line
+                buffer_parts.append(line)
                 current_chunk_tokens = candidate_tokens
 
         # Capture final buffer if any content remains
-        if buffer:
-            chunks.append((buffer, current_chunk_tokens, False))
+        if buffer_parts:
+            chunks.append(("".join(buffer_parts), current_chunk_tokens, False))
 
         return chunks
 
     def _log_chunk_boundaries(self, chunks: list[tuple[str, int, bool]]) -> None:
-        for idx, (chunk_text, _chunk_tokens, _oversized) in enumerate(chunks, start=1):
-            logger.info("chunk=%d boundary len=%d", idx, len(chunk_text))
+        """Log one chunking summary, plus per-chunk boundaries at DEBUG."""
+        logger.info(
+            "chunks=%d tokens=%d max_chunk_tokens=%d",
+            len(chunks),
+            sum(chunk_tokens for _text, chunk_tokens, _oversized in chunks),
+            max(
+                (chunk_tokens for _text, chunk_tokens, _oversized in chunks), default=0
+            ),
+        )
+        # Skip building per-chunk records entirely unless DEBUG is on
+        if not logger.isEnabledFor(logging.DEBUG):
+            return
+        for idx, (chunk_text, chunk_tokens, _oversized) in enumerate(chunks, start=1):
+            logger.debug(
+                "chunk=%d boundary len=%d tokens=%d", idx, len(chunk_text), chunk_tokens
+            )
 
     # Trace: SPEC-TRANSLATION-001, TEST-TRANSLATION-001-AC2
     # Trace: SPEC-BALANCED-CHUNKS-001, AC-1, AC-2, AC-3, AC-4, AC-5, AC-6, AC-7
@@ -252,6 +358,7 @@ class StreamingTranslator:
         chunk_text: str,
         progress: Progress | None = None,
         task_id: TaskID | None = None,
+        input_tokens: int | None = None,
     ) -> str:
         """Call OpenAI for a single chunk and return translated content.
 
@@ -261,6 +368,8 @@ class StreamingTranslator:
             progress: Optional progress tracker. If None, updates are skipped.
             task_id: Optional task ID for progress tracking. Only used if
                 progress is not None.
+            input_tokens: Token count of chunk_text if already known (from
+                chunking); counted here when None.
 
         Returns:
             Translated text content
@@ -277,20 +386,25 @@ class StreamingTranslator:
         else:
             actual_progress = progress
 
-        prompt = self.config.PROMPT_TEMPLATE.format(
-            glossary=self.config.glossary,
-            text=chunk_text,
-        )
+        messages = self.config.build_messages(chunk_text)
 
         # 예상 출력 토큰 수 추정 (입력 토큰 수 기반)
-        input_tokens = self.token_counter.count_tokens(chunk_text)
+        # 청크 생성 시 이미 센 값이 있으면 다시 토큰화하지 않음
+        if input_tokens is None:
+            input_tokens = self.token_counter.count_tokens(chunk_text)
         # 한글 번역은 보통 입력보다 1.2-1.5배 정도
         estimated_output_tokens = int(input_tokens * self.ESTIMATED_OUTPUT_TOKEN_RATIO)
 
+        # RPM/TPM 한도 내로 요청 속도 조절 (429 재시도 대기 방지)
+        # 시스템 프롬프트도 매 요청마다 전송되므로 TPM 예산에 포함
+        self.rate_limiter.acquire(
+            self._get_system_prompt_tokens() + input_tokens + estimated_output_tokens
+        )
+
         try:
             response = self.client.chat.completions.create(
                 model=self.config.model,
-                messages=[{"role": "user", "content": prompt}],
+                messages=messages,
                 temperature=self.config.temperature,
                 timeout=self.API_TIMEOUT_SECONDS,  # 3분 타임아웃 (큰 청크 처리용)
                 stream=True,  # 스트리밍 활성화
@@ -299,23 +413,30 @@ class StreamingTranslator:
             # 스트리밍 응답 수집 with 진행률 표시
             content_parts: list[str] = []
             received_chars = 0
+            next_progress_at = 0.0
 
             for stream_chunk in response:
-                if stream_chunk.choices[0].delta.content:
-                    chunk_content = stream_chunk.choices[0].delta.content
-                    content_parts.append(chunk_content)
-                    received_chars += len(chunk_content)
-
-                    # 진행률 업데이트 (프로그레스바 또는 로그)
-                    # 한글 평균: 1글자 ≈ 2.5 토큰
-                    estimated_tokens = int(
-                        received_chars * self.KOREAN_CHAR_TO_TOKEN_RATIO
-                    )
-                    completed = min(estimated_tokens, estimated_output_tokens)
-                    if task_id is not None:
-                        actual_progress.update(
-                            task_id, completed=completed, total=estimated_output_tokens
-                        )
+                chunk_content = stream_chunk.choices[0].delta.content
+                if not chunk_content:
+                    continue
+                content_parts.append(chunk_content)
+                if task_id is None:
+                    # 진행률 표시가 없으면 델타당 추가 계산 생략
+                    continue
+
+                # 진행률 업데이트 (프로그레스바 또는 로그)
+                # 한글 평균: 1글자 ≈ 2.5 토큰
+                received_chars += len(chunk_content)
+                # 델타마다 갱신하지 않고 PROGRESS_UPDATE_INTERVAL_SECONDS 간격으로 합침
+                now = time.monotonic()
+                if now < next_progress_at:
+                    continue
+                next_progress_at = now + self.PROGRESS_UPDATE_INTERVAL_SECONDS
+                estimated_tokens = int(received_chars * self.KOREAN_CHAR_TO_TOKEN_RATIO)
+                completed = min(estimated_tokens, estimated_output_tokens)
+                actual_progress.update(
+                    task_id, completed=completed, total=estimated_output_tokens
+                )
 
             content: str | None = "".join(content_parts) if content_parts else None
 
@@ -324,13 +445,48 @@ class StreamingTranslator:
                 actual_progress.update(task_id, completed=estimated_output_tokens)
         except Exception as exc:  # pragma: no cover - exercised via mocks
             logger.exception("OpenAI API 호출 중 오류 발생 (chunk=%d)", chunk_index)
-            raise TranslationError(is_transient=True) from exc
+            raise TranslationError(
+                is_transient=True, retry_after=_retry_after_seconds(exc)
+            ) from exc
 
         if not content:
             raise TranslationError(is_transient=False)
 
         return content
 
+    def _get_system_prompt_tokens(self) -> int:
+        """Return the system prompt's token count, measuring it on first use.
+
+        The first measurement also logs whether the static prefix is long
+        enough for OpenAI's automatic prompt caching. Workers racing on the
+        first call at worst count twice; the result is identical.
+        """
+        if self._system_prompt_tokens is None:
+            tokens = self.token_counter.count_tokens(self.config.system_prompt)
+            self._system_prompt_tokens = tokens
+            logger.info(
+                "system prompt tokens=%d prompt_cache_eligible=%s (min=%d)",
+                tokens,
+                tokens >= self.PROMPT_CACHE_MIN_TOKENS,
+                self.PROMPT_CACHE_MIN_TOKENS,
+            )
+        return self._system_prompt_tokens
+
+    def _retry_delay(self, attempt: int, retry_after: float | None = None) -> float:
+        """Return the delay before retrying after a failed attempt.
+
+        A server Retry-After hint wins when present and is honoured even above
+        retry_backoff_max_seconds, since retrying earlier would only spend an
+        attempt on another rate-limit error; only RETRY_AFTER_MAX_SECONDS
+        bounds it. Otherwise the delay is drawn uniformly from zero up to the
+        capped exponential backoff ("full jitter"), so parallel workers that
+        failed together do not retry in lockstep.
+        """
+        if retry_after is not None:
+            return min(self.RETRY_AFTER_MAX_SECONDS, retry_after)
+        delay = self.retry_backoff_seconds * (2 ** (attempt - 1))
+        return random.uniform(0.0, min(self.retry_backoff_max_seconds, delay))
+
     # Trace: SPEC-TRANSLATION-001, TEST-TRANSLATION-001-AC3
     # Trace: SPEC-TRANSLATION-001, TEST-TRANSLATION-001-AC4
     # Trace: SPEC-TRANSLATION-001, TEST-TRANSLATION-001-AC5
@@ -342,6 +498,7 @@ class StreamingTranslator:
         chunk_text: str,
         progress: Progress | None = None,
         task_id: TaskID | None = None,
+        input_tokens: int | None = None,
     ) -> str | None:
         """Translate a chunk with retry/backoff logic.
 
@@ -352,6 +509,8 @@ class StreamingTranslator:
                 The method is safe to call with progress=None.
             task_id: Optional task ID for progress tracking. Only used if
                 progress is not None.
+            input_tokens: Precomputed token count of chunk_text, passed on to
+                _invoke_model so retries do not re-tokenize the chunk.
 
         Returns:
             Translated text content, or None if all retry attempts failed
@@ -361,6 +520,17 @@ class StreamingTranslator:
             updates are performed. The method delegates to _invoke_model which handles
             the None case with a NoOp progress handler internally.
         """
+        # 이전 실행에서 같은 요청으로 번역한 결과가 있으면 재사용
+        cache_key: str | None = None
+        if self.translation_cache.enabled:
+            cache_key = self.translation_cache.key(
+                self.config.system_prompt, chunk_text
+            )
+            cached = self.translation_cache.get(cache_key)
+            if cached is not None:
+                logger.info("chunk=%d translation cache hit", chunk_index)
+                return cached
+
         # Defensive: Validate progress/task_id relationship
         # Note: _invoke_model handles None progress internally with NoOpProgress
         max_attempts = self.max_retries + 1
@@ -368,7 +538,7 @@ class StreamingTranslator:
         for attempt in range(1, max_attempts + 1):
             try:
                 translation = self._invoke_model(
-                    chunk_index, chunk_text, progress, task_id
+                    chunk_index, chunk_text, progress, task_id, input_tokens
                 )
             except TranslationError as exc:
                 if exc.is_transient:
@@ -382,8 +552,8 @@ class StreamingTranslator:
                     if attempt == max_attempts:
                         logger.exception("chunk=%d retry limit exceeded", chunk_index)
                         return None
-                    if self.retry_backoff_seconds > 0:
-                        time.sleep(self.retry_backoff_seconds)
+                    if exc.retry_after is not None or self.retry_backoff_seconds > 0:
+                        time.sleep(self._retry_delay(attempt, exc.retry_after))
                     continue
                 logger.exception("chunk=%d permanent failure", chunk_index)
                 return None
@@ -394,37 +564,12 @@ class StreamingTranslator:
                     attempt,
                     max_attempts,
                 )
+                if cache_key is not None:
+                    self.translation_cache.put(cache_key, translation)
                 return translation
 
         return None  # pragma: no cover
 
-    # Trace: SPEC-REFACTOR-DEDUP-001, TASK-20251228-REFACTOR-DEDUP-001
-    # Trace: TEST-REFACTOR-DEDUP-001-AC1, TEST-REFACTOR-DEDUP-001-AC2
-    def _write_translations(
-        self,
-        results: dict[int, str],
-        chunks: list[tuple[int, str]],
-        output_file: str,
-    ) -> None:
-        """Write translated content to file with correct formatting.
-
-        Args:
-            results: Dictionary mapping chunk_index to translated content
-            chunks: List of (chunk_index, chunk_text) tuples in original order
-            output_file: Path to output file
-
-        Note:
-            Writes chunks in original order with double newline between chunks.
-            Only writes chunks that were successfully translated (exist in results).
-        """
-        # Extract translated content in original chunk order
-        translated_content = [
-            results[chunk_index] for chunk_index, _ in chunks if chunk_index in results
-        ]
-
-        with Path(output_file).open("w", encoding="utf-8") as file:
-            file.writelines(content + "\n\n" for content in translated_content)
-
     # Trace: SPEC-REFACTOR-DEDUP-001, TASK-20251228-REFACTOR-DEDUP-001
     # Trace: TEST-REFACTOR-DEDUP-001-AC3, TEST-REFACTOR-DEDUP-001-AC4
     def _update_task_progress(
@@ -457,6 +602,22 @@ class StreamingTranslator:
                 visible=False,
             )
 
+    def _load_chunks(self) -> list[tuple[str, int, bool]]:
+        """Read the input file and build merged chunks.
+
+        The source line list only lives for the duration of this call, so it
+        is released before translation starts instead of being held alongside
+        the chunk texts for the whole run.
+        """
+        try:
+            with self._input_path.open(encoding="utf-8") as file:
+                lines = file.readlines()
+        except FileNotFoundError:
+            logger.exception("입력 파일을 찾을 수 없습니다: %s", self.input_file)
+            raise
+
+        return self._merge_tiny_last_chunk(self._build_chunks(lines))
+
     # Trace: SPEC-TRANSLATION-001, TEST-TRANSLATION-001-AC1
     # Trace: SPEC-TRANSLATION-001, TEST-TRANSLATION-001-AC7
     # Trace: SPEC-TRANSLATION-001, TEST-TRANSLATION-001-AC9
@@ -471,20 +632,12 @@ class StreamingTranslator:
         """
         start_time = time.perf_counter()
 
-        try:
-            with Path(self.input_file).open(encoding="utf-8") as file:
-                lines = file.readlines()
-        except FileNotFoundError:
-            logger.exception("입력 파일을 찾을 수 없습니다: %s", self.input_file)
-            raise
-
         # Materialize chunks for progress tracking
-        chunks_with_tokens = self._build_chunks(lines)
-        chunks_with_tokens = self._merge_tiny_last_chunk(chunks_with_tokens)
+        chunks_with_tokens = self._load_chunks()
         self._log_chunk_boundaries(chunks_with_tokens)
         chunks = [
-            (idx, chunk_text)
-            for idx, (chunk_text, _chunk_tokens, _oversized) in enumerate(
+            (idx, chunk_text, chunk_tokens)
+            for idx, (chunk_text, chunk_tokens, _oversized) in enumerate(
                 chunks_with_tokens, start=1
             )
         ]
@@ -529,46 +682,106 @@ class StreamingTranslator:
             duration_seconds=duration,
         )
 
+    def _split_duplicate_chunks(
+        self, chunks: list[tuple[int, str, int]]
+    ) -> tuple[list[tuple[int, str, int]], dict[int, list[int]]]:
+        """Separate byte-identical chunks so each distinct text is sent once.
+
+        Args:
+            chunks: List of (chunk_index, chunk_text, chunk_tokens) tuples in
+                original order
+
+        Returns:
+            Tuple of (chunks to translate, mapping of each translated
+            chunk_index to the indices of its later duplicates)
+        """
+        first_index: dict[str, int] = {}
+        unique_chunks: list[tuple[int, str, int]] = []
+        duplicates: dict[int, list[int]] = {}
+        for chunk_index, chunk_text, chunk_tokens in chunks:
+            source_index = first_index.setdefault(chunk_text, chunk_index)
+            if source_index == chunk_index:
+                unique_chunks.append((chunk_index, chunk_text, chunk_tokens))
+            else:
+                duplicates.setdefault(source_index, []).append(chunk_index)
+        return unique_chunks, duplicates
+
+    def _record_result(  # noqa: PLR0913
+        self,
+        writer: _OrderedChunkWriter,
+        chunk_index: int,
+        translation: str | None,
+        *,
+        duplicates: dict[int, list[int]],
+        progress: Progress,
+        overall_task: TaskID,
+    ) -> tuple[int, int]:
+        """Hand a chunk's outcome (and its duplicates') to the output writer.
+
+        Returns:
+            Tuple of (successes, failures) covering the chunk and its duplicates
+        """
+        copies = duplicates.get(chunk_index, [])
+        translation = translation or None
+        writer.resolve(chunk_index, translation)
+        for copy_index in copies:
+            writer.resolve(copy_index, translation)
+            if translation is not None:
+                logger.info(
+                    "chunk=%d duplicate of chunk=%d, reusing translation",
+                    copy_index,
+                    chunk_index,
+                )
+
+        # Update overall progress
+        resolved = 1 + len(copies)
+        progress.update(overall_task, advance=resolved)
+        if translation is None:
+            return 0, resolved
+        return resolved, 0
+
     def _translate_sequential(
         self,
-        chunks: list[tuple[int, str]],
+        chunks: list[tuple[int, str, int]],
         progress: Progress,
         overall_task: TaskID,
     ) -> TranslationRunResult:
         """Sequential translation (original behavior)."""
-        translated_results: dict[int, str] = {}
         successes = 0
         failures = 0
+        unique_chunks, duplicates = self._split_duplicate_chunks(chunks)
 
-        for chunk_index, chunk_text in chunks:
-            # Add individual chunk task
-            chunk_task = progress.add_task(
-                f"[green]Chunk {chunk_index}", total=100, start=True
-            )
+        with self._output_path.open("w", encoding="utf-8") as output:
+            writer = _OrderedChunkWriter(output, [idx for idx, _, _ in chunks])
 
-            translation = self._translate_chunk(
-                chunk_index, chunk_text, progress, chunk_task
-            )
+            for chunk_index, chunk_text, chunk_tokens in unique_chunks:
+                # Add individual chunk task
+                chunk_task = progress.add_task(
+                    f"[green]Chunk {chunk_index}", total=100, start=True
+                )
 
-            if translation:
-                translated_results[chunk_index] = translation
-                successes += 1
-            else:
-                failures += 1
-
-            # Update task progress (unified method)
-            self._update_task_progress(
-                success=translation is not None,
-                chunk_index=chunk_index,
-                progress=progress,
-                task_id=chunk_task,
-            )
+                translation = self._translate_chunk(
+                    chunk_index, chunk_text, progress, chunk_task, chunk_tokens
+                )
 
-            # Update overall progress
-            progress.update(overall_task, advance=1)
+                # Update task progress (unified method)
+                self._update_task_progress(
+                    success=translation is not None,
+                    chunk_index=chunk_index,
+                    progress=progress,
+                    task_id=chunk_task,
+                )
 
-        # Write translations (unified method)
-        self._write_translations(translated_results, chunks, self.output_file)
+                chunk_successes, chunk_failures = self._record_result(
+                    writer,
+                    chunk_index,
+                    translation,
+                    duplicates=duplicates,
+                    progress=progress,
+                    overall_task=overall_task,
+                )
+                successes += chunk_successes
+                failures += chunk_failures
 
         return TranslationRunResult(
             successes=successes,
@@ -578,75 +791,92 @@ class StreamingTranslator:
 
     def _translate_parallel(
         self,
-        chunks: list[tuple[int, str]],
+        chunks: list[tuple[int, str, int]],
         progress: Progress,
         overall_task: TaskID,
     ) -> TranslationRunResult:
         """Parallel translation using ThreadPoolExecutor.
 
-        Chunks are processed in parallel up to max_workers limit.
-        Results are collected in original chunk order.
+        Chunks are processed in parallel up to max_workers limit, with at most
+        IN_FLIGHT_PER_WORKER submitted chunks per worker at a time.
+        Results are written in original chunk order as soon as every earlier
+        chunk has finished. Byte-identical chunks are translated once and the
+        result is reused for every copy.
         """
-        # Dictionary to store futures and results by chunk_index
-        future_to_chunk: dict[Future[str | None], int] = {}
-        chunk_to_task: dict[int, TaskID] = {}
-        translated_results: dict[int, str] = {}
+        # In-flight futures mapped to (chunk_index, chunk progress task)
+        in_flight: dict[Future[str | None], tuple[int, TaskID]] = {}
+        max_in_flight = self.max_workers * self.IN_FLIGHT_PER_WORKER
         successes = 0
         failures = 0
+        unique_chunks, duplicates = self._split_duplicate_chunks(chunks)
+        remaining = iter(unique_chunks)
 
-        # Create task for each chunk
-        for chunk_index, _ in chunks:
-            chunk_task = progress.add_task(
-                f"[green]Chunk {chunk_index}", total=100, start=True
-            )
-            chunk_to_task[chunk_index] = chunk_task
-
-        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
-            # Submit all chunks for parallel processing
-            for chunk_index, chunk_text in chunks:
-                task_id = chunk_to_task[chunk_index]
-                future = executor.submit(
-                    self._translate_chunk, chunk_index, chunk_text, progress, task_id
-                )
-                future_to_chunk[future] = chunk_index
-
-            # Collect results as they complete
-            for future in as_completed(future_to_chunk):
-                chunk_index = future_to_chunk[future]
-                chunk_task = chunk_to_task[chunk_index]
-
-                try:
-                    translation = future.result()
-                    if translation:
-                        translated_results[chunk_index] = translation
-                        successes += 1
-                    else:
-                        failures += 1
-
-                    # Update task progress (unified method)
-                    self._update_task_progress(
-                        success=translation is not None,
-                        chunk_index=chunk_index,
-                        progress=progress,
-                        task_id=chunk_task,
+        with (
+            self._output_path.open("w", encoding="utf-8") as output,
+            ThreadPoolExecutor(max_workers=self.max_workers) as executor,
+        ):
+            writer = _OrderedChunkWriter(output, [idx for idx, _, _ in chunks])
+
+            while True:
+                # Top up a bounded window of chunks, submitted in original
+                # order so the ordered writer's backlog stays small too
+                while len(in_flight) < max_in_flight:
+                    next_chunk = next(remaining, None)
+                    if next_chunk is None:
+                        break
+                    chunk_index, chunk_text, chunk_tokens = next_chunk
+                    chunk_task = progress.add_task(
+                        f"[green]Chunk {chunk_index}", total=100, start=True
                     )
-                except Exception:
-                    logger.exception("chunk=%d raised exception", chunk_index)
-                    failures += 1
-                    # Update task progress for exception case
-                    self._update_task_progress(
-                        success=False,
-                        chunk_index=chunk_index,
-                        progress=progress,
-                        task_id=chunk_task,
-                        reason="error",
+                    future = executor.submit(
+                        self._translate_chunk,
+                        chunk_index,
+                        chunk_text,
+                        progress,
+                        chunk_task,
+                        chunk_tokens,
                     )
+                    in_flight[future] = (chunk_index, chunk_task)
+
+                if not in_flight:
+                    break
 
-                # Update overall progress
-                progress.update(overall_task, advance=1)
+                done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                for future in sorted(done, key=lambda f: in_flight[f][0]):
+                    chunk_index, chunk_task = in_flight.pop(future)
 
-        # Write translations (unified method)
-        self._write_translations(translated_results, chunks, self.output_file)
+                    try:
+                        translation = future.result()
+
+                        # Update task progress (unified method)
+                        self._update_task_progress(
+                            success=translation is not None,
+                            chunk_index=chunk_index,
+                            progress=progress,
+                            task_id=chunk_task,
+                        )
+                    except Exception:
+                        logger.exception("chunk=%d raised exception", chunk_index)
+                        translation = None
+                        # Update task progress for exception case
+                        self._update_task_progress(
+                            success=False,
+                            chunk_index=chunk_index,
+                            progress=progress,
+                            task_id=chunk_task,
+                            reason="error",
+                        )
+
+                    chunk_successes, chunk_failures = self._record_result(
+                        writer,
+                        chunk_index,
+                        translation,
+                        duplicates=duplicates,
+                        progress=progress,
+                        overall_task=overall_task,
+                    )
+                    successes += chunk_successes
+                    failures += chunk_failures
 
         return TranslationRunResult(
             successes=successes,
@@ -656,5 +886,9 @@ class StreamingTranslator:
 
     # Trace: SPEC-TRANSLATION-001, TEST-TRANSLATION-001-AC8
     def format_output(self) -> None:
-        """Format the output file with consistent indentation."""
+        """Format the output file with consistent indentation.
+
+        translate() already writes indented output; this re-applies the
+        (idempotent) formatting to an existing file.
+        """
         OutputFormatter.format_output(self.output_file)
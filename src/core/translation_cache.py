@@ -0,0 +1,119 @@
+"""Persistent translation cache so re-runs skip chunks already paid for."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import threading
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+
+class TranslationCache:
+    """Append-only JSONL cache of translations keyed by a request hash.
+
+    Keys hash the model, temperature and the rendered prompt parts (system
+    prompt with glossary, plus the chunk text), so changing any of them misses
+    the cache instead of returning a stale translation. Each entry is written
+    by opening the file in append mode and closing it again as soon as it is
+    stored, so completed chunks survive a crash mid-run; a torn last line is
+    skipped on load. With ``path=None`` the cache is disabled and every lookup
+    misses. The cache is optional, so an unwritable path never fails a
+    translation: it is logged and caching is switched off for the run.
+    """
+
+    def __init__(self, path: str | None, model: str, temperature: float) -> None:
+        """Load existing entries from ``path``, creating its directory.
+
+        Args:
+            path: JSONL cache file (None disables caching).
+            model: Model name mixed into every key.
+            temperature: Sampling temperature mixed into every key.
+        """
+        self._path: Path | None = Path(path) if path else None
+        self._key_prefix = f"{model}\x00{temperature!r}\x00"
+        self._entries: dict[str, str] = {}
+        self._lock = threading.Lock()
+        # True when the file ends mid-line (e.g. a write torn by a crash)
+        self._needs_newline = False
+        if self._path is None:
+            return
+        try:
+            self._path.parent.mkdir(parents=True, exist_ok=True)
+        except OSError as exc:
+            self._disable("cannot create directory", exc)
+            return
+        if self._path.exists():
+            try:
+                self._load(self._path)
+            except OSError as exc:
+                self._disable("read failed", exc)
+
+    @property
+    def enabled(self) -> bool:
+        """Return True when a usable cache file is configured."""
+        return self._path is not None
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _disable(self, reason: str, exc: OSError) -> None:
+        logger.warning("translation cache %s disabled, %s: %s", self._path, reason, exc)
+        self._path = None
+
+    def _load(self, path: Path) -> None:
+        with path.open(encoding="utf-8") as file:
+            for line_number, line in enumerate(file, start=1):
+                self._needs_newline = not line.endswith("\n")
+                if line.isspace():
+                    continue
+                try:
+                    entry = json.loads(line)
+                    self._entries[entry["key"]] = entry["translation"]
+                except (ValueError, KeyError, TypeError):
+                    logger.warning(
+                        "translation cache %s line %d unreadable, skipped",
+                        path,
+                        line_number,
+                    )
+        logger.info("translation cache loaded entries=%d", len(self._entries))
+
+    def key(self, *prompt_parts: str) -> str:
+        """Return the cache key for the rendered prompt parts of a request."""
+        payload = self._key_prefix + "\x00".join(prompt_parts)
+        return hashlib.sha256(
+            payload.encode("utf-8"), usedforsecurity=False
+        ).hexdigest()
+
+    def get(self, key: str) -> str | None:
+        """Return the cached translation for ``key``, or None on a miss."""
+        return self._entries.get(key)
+
+    def put(self, key: str, translation: str) -> None:
+        """Store a translation and append it to the cache file.
+
+        Thread-safe: parallel workers may call this concurrently. Never
+        raises on I/O errors; a failed append disables the cache instead.
+        """
+        with self._lock:
+            # Checked under the lock: another worker's failed append may
+            # have just disabled the cache
+            path = self._path
+            if path is None:
+                return
+            self._entries[key] = translation
+            record = json.dumps(
+                {"key": key, "translation": translation}, ensure_ascii=False
+            )
+            if self._needs_newline:
+                # Keep the new record off the torn line so it stays loadable
+                record = "\n" + record
+            try:
+                with path.open("a", encoding="utf-8") as file:
+                    file.write(record + "\n")
+            except OSError as exc:
+                self._disable("write failed", exc)
+                return
+            self._needs_newline = False
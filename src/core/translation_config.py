@@ -3,12 +3,22 @@ import logging
 from pathlib import Path
 from typing import Any
 
+from openai.types.chat import (
+    ChatCompletionMessageParam,
+    ChatCompletionSystemMessageParam,
+    ChatCompletionUserMessageParam,
+)
+
 from src import config
 
 # Trace: SPEC-CONFIG-001, TASK-20251117-01
 
 logger = logging.getLogger(__name__)
 
+# Rendered glossaries keyed by (resolved path, mtime_ns, size); edits to the
+# file invalidate, and size catches rewrites within one coarse mtime tick
+_GLOSSARY_CACHE: dict[tuple[str, int, int], str] = {}
+
 
 class TranslationConfig:
     """Configuration for academic paper translation using OpenAI API.
@@ -16,7 +26,9 @@ class TranslationConfig:
     Provides prompt template, model settings, and glossary for translation tasks.
     """
 
-    PROMPT_TEMPLATE: str = """Translate this academic paper to Korean.
+    # Static per run: instructions + glossary go first as the system message
+    # so OpenAI prompt caching can reuse them across every chunk request.
+    SYSTEM_PROMPT_TEMPLATE: str = """Translate the user's academic paper text to Korean.
 
 Requirements:
 - Use formal academic style
@@ -28,9 +40,6 @@ Requirements:
 
 Glossary:
 {glossary}
-
-Text:
-{text}
 """
 
     def __init__(
@@ -55,6 +64,29 @@ Text:
         )
         glossary_source = glossary_path or config.GLOSSARY_FILE
         self.glossary: str = self._load_glossary_from_json(glossary_source)
+        self.system_prompt: str = self.SYSTEM_PROMPT_TEMPLATE.format(
+            glossary=self.glossary
+        )
+
+    def build_messages(self, text: str) -> list[ChatCompletionMessageParam]:
+        """Return the chat messages for a chunk of source text.
+
+        The system message (instructions and glossary) is rendered once at
+        construction and is byte-identical for every chunk, keeping the
+        cacheable prefix stable; only the user message varies.
+
+        Args:
+            text: Source text to translate.
+
+        Returns:
+            System and user messages for the chat completions API.
+        """
+        system_message: ChatCompletionSystemMessageParam = {
+            "role": "system",
+            "content": self.system_prompt,
+        }
+        user_message: ChatCompletionUserMessageParam = {"role": "user", "content": text}
+        return [system_message, user_message]
 
     def _load_glossary_from_json(self, glossary_path: str) -> str:
         """Load glossary from JSON file and format for prompt template.
@@ -63,19 +95,29 @@ Text:
             glossary_path: Path to the glossary JSON file.
 
         Returns:
-            Formatted glossary string for inclusion in prompts.
+            Formatted glossary string for inclusion in prompts. Results are
+            cached per resolved path, modification time and size, so repeated
+            instances skip re-reading an unchanged file.
 
         Raises:
             FileNotFoundError: If glossary file does not exist.
         """
-        if not Path(glossary_path).exists():
+        path = Path(glossary_path)
+        if not path.exists():
             msg = f"Glossary file not found at {glossary_path}"
             raise FileNotFoundError(msg)
 
-        with Path(glossary_path).open(encoding="utf-8") as f:
+        stat = path.stat()
+        cache_key = (str(path.resolve()), stat.st_mtime_ns, stat.st_size)
+        cached = _GLOSSARY_CACHE.get(cache_key)
+        if cached is not None:
+            return cached
+
+        with path.open(encoding="utf-8") as f:
             data: list[dict[str, Any]] = json.load(f)
 
-        glossary_str = ""
-        for item in data:
-            glossary_str += f"- {item['term']} > {item['translation']}\n"
-        return glossary_str.strip()
+        glossary_str = "\n".join(
+            f"- {item['term']} > {item['translation']}" for item in data
+        ).strip()
+        _GLOSSARY_CACHE[cache_key] = glossary_str
+        return glossary_str
@@ -45,14 +45,11 @@ def main() -> None:
     preprocessor = TextPreprocessor()
     preprocessor.run()
 
-    # 2. 번역
+    # 2. 번역 (출력 포맷팅은 결과를 쓸 때 함께 적용)
     try:
         translator = StreamingTranslator(input_file=config.INPUT_FILE)
         metrics = translator.translate()
 
-        # 3. 출력 포맷팅
-        translator.format_output()
-
         logger.info(
             "번역 요약 - 성공: %d개, 실패: %d개, 소요 시간: %.2f초",
             metrics.successes,
@@ -9,13 +9,48 @@ logger = logging.getLogger(__name__)
 class OutputFormatter:
     """Utility class for formatting translation output files."""
 
+    INDENT: str = "  "
+
+    @staticmethod
+    def _format_line(line: str) -> str:
+        """Indent a single line (without its newline) unless blank or indented."""
+        # isspace() tests blankness without allocating a stripped copy
+        if not line or line.isspace() or line.startswith(OutputFormatter.INDENT):
+            return line
+        return OutputFormatter.INDENT + line
+
+    @staticmethod
+    def format_text(text: str) -> str:
+        """
+        Apply output indentation to a block of text in memory.
+
+        Produces the same result as writing ``text`` to a file and running
+        ``format_output`` on it, so writers can emit formatted output in a
+        single pass. Like the text-mode read in ``format_output``, ``\r\n``
+        and lone ``\r`` line endings are normalized to ``\n``.
+
+        Args:
+            text: Text block, possibly spanning multiple lines.
+
+        Returns:
+            The text with every non-empty, non-indented line prefixed by two
+            spaces.
+        """
+        # Same universal-newline handling as reading the file in text mode
+        normalized = text.replace("\r\n", "\n").replace("\r", "\n")
+        return "\n".join(
+            OutputFormatter._format_line(line) for line in normalized.split("\n")
+        )
+
     @staticmethod
     def format_output(file_path: str) -> None:
         """
         Format the output file by adding indentation to non-empty lines.
 
         Each non-empty line that doesn't start with spaces will be prefixed
-        with two spaces for consistent indentation.
+        with two spaces for consistent indentation. Lines are streamed into a
+        sibling temporary file that atomically replaces the original, so a
+        crash mid-write never leaves a truncated output file.
 
         Args:
             file_path: Path to the output file to format.
@@ -24,24 +59,24 @@ class OutputFormatter:
             FileNotFoundError: If the file does not exist.
         """
         output_path = Path(file_path)
+        temp_path = output_path.with_name(output_path.name + ".tmp")
 
-        with output_path.open(encoding="utf-8") as f:
-            lines = f.readlines()
-
-        new_lines = []
-        for line in lines:
-            stripped = line.rstrip("\n")
-            if stripped.strip() == "":
-                # Keep empty lines as-is
-                new_lines.append(line)
-            elif not stripped.startswith("  "):
-                # Add indentation to non-indented lines
-                new_lines.append("  " + stripped + "\n")
-            else:
-                # Keep already indented lines as-is
-                new_lines.append(line)
-
-        with output_path.open("w", encoding="utf-8") as f:
-            f.writelines(new_lines)
+        try:
+            with (
+                output_path.open(encoding="utf-8") as source,
+                temp_path.open("w", encoding="utf-8") as target,
+            ):
+                for line in source:
+                    stripped = line.rstrip("\n")
+                    formatted = OutputFormatter._format_line(stripped)
+                    if formatted == stripped:
+                        # Keep empty and already indented lines as-is
+                        target.write(line)
+                    else:
+                        target.write(formatted + "\n")
+            temp_path.replace(output_path)
+        except BaseException:
+            temp_path.unlink(missing_ok=True)
+            raise
 
         logger.info("Output formatting completed for %s", file_path)
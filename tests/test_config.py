@@ -36,6 +36,15 @@ def test_missing_required_env_vars() -> None:
         _require_env(required)
 
 
+def test_invalid_required_env_var(monkeypatch) -> None:
+    """Test that _require_env reports values its caster rejects"""
+    monkeypatch.setenv("INVALID_INT_VAR_12345", "not-a-number")
+    required: dict[str, Callable[[str], object]] = {"INVALID_INT_VAR_12345": int}
+
+    with pytest.raises(ValueError, match="INVALID_INT_VAR_12345 is invalid"):
+        _require_env(required)
+
+
 def test_model_token_limits_fallback_to_map(monkeypatch) -> None:
     """Uses model map defaults when env overrides are absent."""
     monkeypatch.setenv("OPENAI_MODEL", "gpt-5-mini")
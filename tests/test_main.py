@@ -38,7 +38,8 @@ class TestMain:
         mock_preprocessor.run.assert_called_once()
         mock_translator_class.assert_called_once_with(input_file="_trimmed_text.txt")
         mock_translator.translate.assert_called_once()
-        mock_translator.format_output.assert_called_once()
+        # Output is indented while translate() writes it; no second file pass
+        mock_translator.format_output.assert_not_called()
         mock_exit.assert_not_called()
 
     # Trace: SPEC-CLI-EXIT-001, TEST-CLI-EXIT-001-AC2
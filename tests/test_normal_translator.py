@@ -1,8 +1,12 @@
 # GENERATED FROM SPEC-TRANSLATION-001
 
+import io
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from unittest.mock import ANY, Mock, patch
 
 import pytest
+from openai import RateLimitError
 from rich.progress import Progress, TaskID
 
 from src.core.streaming_translator import (
@@ -10,18 +14,33 @@ from src.core.streaming_translator import (
     StreamingTranslator,
     TranslationError,
     TranslationRunResult,
+    _OrderedChunkWriter,
 )
+from src.utils.output_formatter import OutputFormatter
 
 
-def _build_config(prompt: str = "Translate: {text}") -> Mock:
+def _build_config(system_prompt: str = "Translate to Korean.") -> Mock:
     config = Mock()
-    config.PROMPT_TEMPLATE = prompt
+    config.system_prompt = system_prompt
     config.glossary = "glossary"
     config.model = "gpt-4"
     config.temperature = 0.5
+    config.build_messages.side_effect = lambda text: [
+        {"role": "system", "content": system_prompt},
+        {"role": "user", "content": text},
+    ]
     return config
 
 
+def _patch_token_counter(translator: StreamingTranslator, count):
+    """Patch single and batch token counting with the same fake counter."""
+    return patch.multiple(
+        translator.token_counter,
+        count_tokens=Mock(side_effect=count),
+        count_tokens_batch=Mock(side_effect=lambda texts: [count(t) for t in texts]),
+    )
+
+
 def _create_streaming_response(content: str | None) -> list:
     """Create a mock streaming response for OpenAI API."""
     if content is None:
@@ -30,6 +49,14 @@ def _create_streaming_response(content: str | None) -> list:
     return [Mock(choices=[Mock(delta=Mock(content=content))])]
 
 
+def _write_ordered(output_file, results: dict[int, str], chunk_indices: list[int]):
+    """Resolve every chunk in order through _OrderedChunkWriter into a file."""
+    with output_file.open("w", encoding="utf-8") as file:
+        writer = _OrderedChunkWriter(file, chunk_indices)
+        for chunk_index in chunk_indices:
+            writer.resolve(chunk_index, results.get(chunk_index))
+
+
 class TestTranslator:
     # Trace: SPEC-TRANSLATION-001, TEST-TRANSLATION-001-AC2
     # Updated for SPEC-BALANCED-CHUNKS-001: balanced distribution changes
@@ -46,11 +73,7 @@ class TestTranslator:
 
         lines = ["first\n", "second\n", "third\n"]
 
-        with patch.object(
-            translator.token_counter,
-            "count_tokens",
-            side_effect=lambda text: len(text.splitlines()) * 5,
-        ):
+        with _patch_token_counter(translator, lambda text: len(text.splitlines()) * 5):
             chunks = list(translator.chunk_generator(lines))
 
         # Balanced chunking: 15 tokens total, max 10 → 2 chunks with target ~7.5 each
@@ -77,7 +100,7 @@ class TestTranslator:
         result = translator._translate_chunk(1, "Hello world")
 
         assert result == "번역된 텍스트"
-        mock_invoke.assert_called_once_with(1, "Hello world", None, None)
+        mock_invoke.assert_called_once_with(1, "Hello world", None, None, None)
 
     # Trace: SPEC-TRANSLATION-001, TEST-TRANSLATION-001-AC4
     # Trace: SPEC-TRANSLATION-001, TEST-TRANSLATION-001-AC5
@@ -102,7 +125,11 @@ class TestTranslator:
         expected_calls = len(responses)
 
         def fake_invoke(
-            _chunk_index: int, _chunk_text: str, _progress=None, _task_id=None
+            _chunk_index: int,
+            _chunk_text: str,
+            _progress=None,
+            _task_id=None,
+            _input_tokens=None,
         ):
             result = responses.pop(0)
             if isinstance(result, Exception):
@@ -172,11 +199,7 @@ class TestTranslator:
                 max_token_length=100,
             )
 
-        with patch.object(
-            translator.token_counter,
-            "count_tokens",
-            side_effect=lambda text: len(text.splitlines()) * 5,
-        ):
+        with _patch_token_counter(translator, lambda text: len(text.splitlines()) * 5):
             metrics = translator.translate()
 
         assert output_file.read_text().strip() == "번역 결과"
@@ -211,6 +234,23 @@ class TestTranslator:
         assert lines[2] == "  Line 2"
         assert lines[3] == "  Already indented"
 
+    def test_format_output_replaces_file_without_leftovers(self, tmp_path):
+        """format_output rewrites via a temp file that does not outlive the call"""
+        output_file = tmp_path / "output.txt"
+        output_file.write_text("Line 1\n\nno trailing newline")
+
+        OutputFormatter.format_output(str(output_file))
+
+        assert output_file.read_text() == "  Line 1\n\n  no trailing newline\n"
+        assert [path.name for path in tmp_path.iterdir()] == ["output.txt"]
+
+    def test_format_output_missing_file_leaves_no_temp(self, tmp_path):
+        """A missing output file raises without creating a temp file"""
+        with pytest.raises(FileNotFoundError):
+            OutputFormatter.format_output(str(tmp_path / "missing.txt"))
+
+        assert list(tmp_path.iterdir()) == []
+
     # Trace: SPEC-TRANSLATION-001, TEST-TRANSLATION-001-AC9
     def test_translate_file_not_found(self):
         """AC-9: missing input raises FileNotFoundError"""
@@ -253,7 +293,11 @@ class TestTranslator:
         ]
 
         def fake_invoke(
-            _chunk_index: int, _chunk_text: str, _progress=None, _task_id=None
+            _chunk_index: int,
+            _chunk_text: str,
+            _progress=None,
+            _task_id=None,
+            _input_tokens=None,
         ):
             result = invoke_results.pop(0)
             if isinstance(result, Exception):
@@ -261,11 +305,7 @@ class TestTranslator:
             return result
 
         with (
-            patch.object(
-                translator.token_counter,
-                "count_tokens",
-                side_effect=lambda text: len(text.splitlines()) * 5,
-            ),
+            _patch_token_counter(translator, lambda text: len(text.splitlines()) * 5),
             patch.object(translator, "_invoke_model", side_effect=fake_invoke),
             caplog.at_level("INFO"),
         ):
@@ -279,6 +319,31 @@ class TestTranslator:
             for record in caplog.records
         )
 
+    def test_chunk_boundaries_log_summary_at_info(self, caplog):
+        """Chunking logs one INFO summary; per-chunk boundaries only at DEBUG"""
+        config = _build_config()
+        with (
+            patch(
+                "src.core.streaming_translator.TranslationConfig", return_value=config
+            ),
+            patch("src.core.streaming_translator.OpenAI"),
+        ):
+            translator = StreamingTranslator(input_file="dummy")
+
+        chunks = [("aaa", 3, False), ("bb", 7, False)]
+
+        with caplog.at_level("INFO", logger="src.core.streaming_translator"):
+            translator._log_chunk_boundaries(chunks)
+        assert caplog.messages == ["chunks=2 tokens=10 max_chunk_tokens=7"]
+
+        caplog.clear()
+        with caplog.at_level("DEBUG", logger="src.core.streaming_translator"):
+            translator._log_chunk_boundaries(chunks)
+        assert caplog.messages[1:] == [
+            "chunk=1 boundary len=3 tokens=3",
+            "chunk=2 boundary len=2 tokens=7",
+        ]
+
     def test_chunk_generator_single_line_exceeds_limit(self, caplog):
         """Test that single line exceeding token limit is yielded as-is with warning"""
         config = _build_config()
@@ -293,11 +358,8 @@ class TestTranslator:
         lines = ["very long single line that exceeds the limit\n"]
 
         with (
-            patch.object(
-                translator.token_counter,
-                "count_tokens",
-                return_value=100,  # Exceeds max_token_length of 10
-            ),
+            # Every line exceeds max_token_length of 10
+            _patch_token_counter(translator, lambda _text: 100),
             caplog.at_level("WARNING"),
         ):
             chunks = list(translator.chunk_generator(lines))
@@ -326,6 +388,145 @@ class TestTranslator:
             translator._invoke_model(1, "test chunk")
         assert exc_info.value.is_transient is False
 
+    def test_invoke_model_coalesces_progress_updates(self):
+        """Stream deltas arriving faster than the update interval share one
+        progress update; completion is always reported"""
+        config = _build_config()
+        mock_client = Mock()
+        mock_client.chat.completions.create.return_value = [
+            Mock(choices=[Mock(delta=Mock(content=part))])
+            for part in ["가", "나", "다", "라", "마"]
+        ]
+
+        with (
+            patch(
+                "src.core.streaming_translator.TranslationConfig", return_value=config
+            ),
+            patch("src.core.streaming_translator.OpenAI", return_value=mock_client),
+        ):
+            translator = StreamingTranslator(input_file="dummy")
+
+        progress = Mock()
+        delta_times = iter([100.0, 100.01, 100.02, 100.06, 100.07])
+        with (
+            _patch_token_counter(translator, lambda _text: 10),
+            patch(
+                "src.core.streaming_translator.time.monotonic",
+                side_effect=lambda: next(delta_times),
+            ),
+        ):
+            result = translator._invoke_model(1, "chunk", progress, TaskID(1))
+
+        # Deltas at t=100.0 and t=100.06 update; then one completion update
+        expected_updates = 3
+        assert result == "가나다라마"
+        assert progress.update.call_count == expected_updates
+        assert progress.update.call_args.kwargs == {"completed": 13}
+
+    def test_invoke_model_sends_system_prompt_and_chunk_as_user(self):
+        """The static system prompt leads; the chunk is the only user content"""
+        config = _build_config(system_prompt="Instructions + glossary")
+        mock_client = Mock()
+        mock_client.chat.completions.create.return_value = _create_streaming_response(
+            "번역"
+        )
+
+        with (
+            patch(
+                "src.core.streaming_translator.TranslationConfig", return_value=config
+            ),
+            patch("src.core.streaming_translator.OpenAI", return_value=mock_client),
+        ):
+            translator = StreamingTranslator(input_file="dummy")
+
+        with _patch_token_counter(translator, lambda _text: 1):
+            translator._invoke_model(1, "source chunk")
+
+        _args, kwargs = mock_client.chat.completions.create.call_args
+        assert kwargs["messages"] == [
+            {"role": "system", "content": "Instructions + glossary"},
+            {"role": "user", "content": "source chunk"},
+        ]
+
+    def test_invoke_model_uses_precomputed_input_tokens(self):
+        """A chunk token count from chunking is budgeted without recounting"""
+        config = _build_config(system_prompt="SYSTEM")
+        mock_client = Mock()
+        mock_client.chat.completions.create.return_value = _create_streaming_response(
+            "번역"
+        )
+
+        with (
+            patch(
+                "src.core.streaming_translator.TranslationConfig", return_value=config
+            ),
+            patch("src.core.streaming_translator.OpenAI", return_value=mock_client),
+        ):
+            translator = StreamingTranslator(input_file="dummy")
+
+        input_tokens = 40
+        with (
+            patch.object(
+                translator.token_counter, "count_tokens", return_value=5
+            ) as mock_count,
+            patch.object(translator.rate_limiter, "acquire") as mock_acquire,
+        ):
+            translator._invoke_model(1, "chunk", input_tokens=input_tokens)
+
+        counted = [call.args[0] for call in mock_count.call_args_list]
+
+        expected_budget = (
+            5
+            + input_tokens
+            + int(input_tokens * translator.ESTIMATED_OUTPUT_TOKEN_RATIO)
+        )
+        assert counted == ["SYSTEM"]
+        mock_acquire.assert_called_once_with(expected_budget)
+
+    def test_system_prompt_tokens_measured_once_and_budgeted(self, caplog):
+        """System prompt tokens are counted once, logged with cache
+        eligibility, and charged to the TPM limiter on every request"""
+        config = _build_config(system_prompt="SYSTEM")
+        mock_client = Mock()
+        mock_client.chat.completions.create.side_effect = lambda **_kwargs: (
+            _create_streaming_response("번역")
+        )
+
+        with (
+            patch(
+                "src.core.streaming_translator.TranslationConfig", return_value=config
+            ),
+            patch("src.core.streaming_translator.OpenAI", return_value=mock_client),
+        ):
+            translator = StreamingTranslator(input_file="dummy")
+
+        def count(text: str) -> int:
+            return 2000 if text == "SYSTEM" else 10
+
+        with (
+            patch.object(
+                translator.token_counter, "count_tokens", side_effect=count
+            ) as mock_count,
+            patch.object(translator.rate_limiter, "acquire") as mock_acquire,
+            caplog.at_level("INFO", logger="src.core.streaming_translator"),
+        ):
+            translator._invoke_model(1, "chunk one")
+            translator._invoke_model(2, "chunk two")
+
+        system_counts = [
+            call.args for call in mock_count.call_args_list if call.args == ("SYSTEM",)
+        ]
+
+        expected_budget = 2000 + 10 + int(10 * translator.ESTIMATED_OUTPUT_TOKEN_RATIO)
+        assert system_counts == [("SYSTEM",)]
+        assert [call.args[0] for call in mock_acquire.call_args_list] == [
+            expected_budget,
+            expected_budget,
+        ]
+        assert [m for m in caplog.messages if "system prompt" in m] == [
+            "system prompt tokens=2000 prompt_cache_eligible=True (min=1024)"
+        ]
+
     def test_translate_chunk_retry_with_backoff(self):
         """Test that retry logic includes sleep backoff when configured"""
         config = _build_config()
@@ -345,7 +546,11 @@ class TestTranslator:
         ]
 
         def fake_invoke(
-            _chunk_index: int, _chunk_text: str, _progress=None, _task_id=None
+            _chunk_index: int,
+            _chunk_text: str,
+            _progress=None,
+            _task_id=None,
+            _input_tokens=None,
         ):
             result = responses.pop(0)
             if isinstance(result, Exception):
@@ -355,12 +560,246 @@ class TestTranslator:
         with (
             patch.object(translator, "_invoke_model", side_effect=fake_invoke),
             patch("src.core.streaming_translator.time.sleep") as mock_sleep,
+            patch(
+                "src.core.streaming_translator.random.uniform",
+                side_effect=lambda _low, high: high,
+            ),
         ):
             result = translator._translate_chunk(1, "test")
 
         assert result == "success"
         mock_sleep.assert_called_once_with(0.5)
 
+    def test_retry_backoff_grows_exponentially_up_to_cap(self):
+        """Retry delays double per attempt and never exceed the configured cap"""
+        config = _build_config()
+        with (
+            patch(
+                "src.core.streaming_translator.TranslationConfig", return_value=config
+            ),
+            patch("src.core.streaming_translator.OpenAI"),
+        ):
+            translator = StreamingTranslator(
+                input_file="dummy",
+                max_retries=4,
+                retry_backoff_seconds=1.0,
+                retry_backoff_max_seconds=5.0,
+            )
+
+        with (
+            patch.object(
+                translator,
+                "_invoke_model",
+                side_effect=TranslationError(is_transient=True, message="busy"),
+            ),
+            patch("src.core.streaming_translator.time.sleep") as mock_sleep,
+            patch(
+                "src.core.streaming_translator.random.uniform",
+                side_effect=lambda _low, high: high,
+            ) as mock_uniform,
+        ):
+            result = translator._translate_chunk(1, "test")
+
+        assert result is None
+        # Upper bounds of the jitter window double per attempt up to the cap
+        assert [call.args for call in mock_uniform.call_args_list] == [
+            (0.0, 1.0),
+            (0.0, 2.0),
+            (0.0, 4.0),
+            (0.0, 5.0),
+        ]
+        assert [call.args[0] for call in mock_sleep.call_args_list] == [
+            1.0,
+            2.0,
+            4.0,
+            5.0,
+        ]
+
+    def test_translate_chunk_reuses_cached_translation(self, tmp_path):
+        """A chunk translated in an earlier run is served from the cache file"""
+        cache_file = tmp_path / "cache.jsonl"
+        config = _build_config()
+
+        def build_translator() -> StreamingTranslator:
+            with (
+                patch(
+                    "src.core.streaming_translator.TranslationConfig",
+                    return_value=config,
+                ),
+                patch("src.core.streaming_translator.OpenAI"),
+            ):
+                return StreamingTranslator(
+                    input_file="dummy", translation_cache_file=str(cache_file)
+                )
+
+        first_run = build_translator()
+        with patch.object(first_run, "_invoke_model", return_value="번역") as first:
+            assert first_run._translate_chunk(1, "text") == "번역"
+        first.assert_called_once()
+
+        second_run = build_translator()
+        with patch.object(second_run, "_invoke_model") as second:
+            assert second_run._translate_chunk(1, "text") == "번역"
+        second.assert_not_called()
+
+    @pytest.mark.parametrize("max_workers", [1, 2])
+    def test_unwritable_translation_cache_keeps_translation(
+        self, tmp_path, max_workers
+    ):
+        """A cache append that fails mid-run never loses a paid translation"""
+        input_file = tmp_path / "input.txt"
+        output_file = tmp_path / "output.txt"
+        cache_dir = tmp_path / "cache"
+        input_file.write_text("line1\n")
+
+        config = _build_config()
+        with (
+            patch(
+                "src.core.streaming_translator.TranslationConfig", return_value=config
+            ),
+            patch("src.core.streaming_translator.OpenAI"),
+        ):
+            translator = StreamingTranslator(
+                input_file=str(input_file),
+                output_file=str(output_file),
+                max_workers=max_workers,
+                translation_cache_file=str(cache_dir / "cache.jsonl"),
+            )
+        cache_dir.rmdir()
+
+        with (
+            _patch_token_counter(translator, lambda _text: 1),
+            patch.object(translator, "_invoke_model", return_value="번역"),
+        ):
+            result = translator.translate()
+
+        assert result.successes == 1
+        assert result.failures == 0
+        assert output_file.read_text(encoding="utf-8") == "  번역\n\n"
+        assert not translator.translation_cache.enabled
+
+    def test_retry_waits_for_server_retry_after(self):
+        """A Retry-After header on a rate-limit error replaces jittered backoff"""
+        config = _build_config()
+        mock_client = Mock()
+        with (
+            patch(
+                "src.core.streaming_translator.TranslationConfig", return_value=config
+            ),
+            patch("src.core.streaming_translator.OpenAI", return_value=mock_client),
+        ):
+            translator = StreamingTranslator(
+                input_file="dummy",
+                max_retries=1,
+                retry_backoff_seconds=1.0,
+                retry_backoff_max_seconds=30.0,
+            )
+
+        response = Mock(status_code=429, headers={"retry-after": "7"})
+        rate_limited = RateLimitError("rate limited", response=response, body=None)
+        success_chunk = Mock()
+        success_chunk.choices = [Mock(delta=Mock(content="번역"))]
+        mock_client.chat.completions.create.side_effect = [
+            rate_limited,
+            [success_chunk],
+        ]
+
+        with (
+            patch.object(translator.token_counter, "count_tokens", return_value=1),
+            patch("src.core.streaming_translator.time.sleep") as mock_sleep,
+            patch("src.core.streaming_translator.random.uniform") as mock_uniform,
+        ):
+            result = translator._translate_chunk(1, "test")
+
+        expected_delay = 7.0
+        assert result == "번역"
+        mock_sleep.assert_called_once_with(expected_delay)
+        mock_uniform.assert_not_called()
+
+    @pytest.mark.parametrize(
+        ("retry_after", "expected_delay"),
+        [(120.0, 120.0), (5000.0, StreamingTranslator.RETRY_AFTER_MAX_SECONDS)],
+    )
+    def test_retry_after_is_not_capped_by_backoff_max(
+        self, retry_after, expected_delay
+    ):
+        """A Retry-After above retry_backoff_max_seconds is honoured; only the
+        separate RETRY_AFTER_MAX_SECONDS ceiling bounds it"""
+        config = _build_config()
+        with (
+            patch(
+                "src.core.streaming_translator.TranslationConfig", return_value=config
+            ),
+            patch("src.core.streaming_translator.OpenAI"),
+        ):
+            translator = StreamingTranslator(
+                input_file="dummy",
+                retry_backoff_seconds=1.0,
+                retry_backoff_max_seconds=60.0,
+            )
+
+        assert translator._retry_delay(1, retry_after) == expected_delay
+
+    def test_translate_parallel_bounds_in_flight_chunks(self, tmp_path):
+        """Parallel mode never has more than max_workers * IN_FLIGHT_PER_WORKER
+        chunks submitted but unfinished, and still writes every chunk in order"""
+        input_file = tmp_path / "input.txt"
+        output_file = tmp_path / "output.txt"
+        input_file.write_text("line1\n")
+
+        config = _build_config()
+        with (
+            patch(
+                "src.core.streaming_translator.TranslationConfig", return_value=config
+            ),
+            patch("src.core.streaming_translator.OpenAI"),
+        ):
+            translator = StreamingTranslator(
+                input_file=str(input_file),
+                output_file=str(output_file),
+                max_token_length=10,
+                max_workers=2,
+            )
+
+        chunk_count = 12
+        chunks = [(f"chunk{i}\n", 10, False) for i in range(1, chunk_count + 1)]
+        max_in_flight = translator.max_workers * translator.IN_FLIGHT_PER_WORKER
+        lock = threading.Lock()
+        state = {"submitted": 0, "finished": 0, "peak": 0}
+        original_submit = ThreadPoolExecutor.submit
+
+        def counting_submit(executor, fn, *args, **kwargs):
+            with lock:
+                state["submitted"] += 1
+                state["peak"] = max(
+                    state["peak"], state["submitted"] - state["finished"]
+                )
+            return original_submit(executor, fn, *args, **kwargs)
+
+        def fake_translate(
+            chunk_index: int,
+            _chunk_text: str,
+            _progress=None,
+            _task_id=None,
+            _input_tokens=None,
+        ) -> str:
+            with lock:
+                state["finished"] += 1
+            return f"t{chunk_index}"
+
+        with (
+            patch.object(translator, "_build_chunks", return_value=chunks),
+            patch.object(translator, "_translate_chunk", side_effect=fake_translate),
+            patch.object(ThreadPoolExecutor, "submit", counting_submit),
+        ):
+            result = translator.translate()
+
+        assert result.successes == chunk_count
+        assert 0 < state["peak"] <= max_in_flight
+        assert output_file.read_text() == "".join(
+            f"  t{i}\n\n" for i in range(1, chunk_count + 1)
+        )
+
     def test_translate_parallel_exception_handling(self, tmp_path, caplog):
         """Test that parallel mode handles exceptions raised by futures"""
         input_file = tmp_path / "input.txt"
@@ -383,7 +822,11 @@ class TestTranslator:
             )
 
         def fake_translate(
-            chunk_index: int, _chunk_text: str, _progress=None, _task_id=None
+            chunk_index: int,
+            _chunk_text: str,
+            _progress=None,
+            _task_id=None,
+            _input_tokens=None,
         ):
             if chunk_index == 1:
                 error_message = "Unexpected error"
@@ -391,11 +834,7 @@ class TestTranslator:
             return "success"
 
         with (
-            patch.object(
-                translator.token_counter,
-                "count_tokens",
-                side_effect=lambda text: len(text.splitlines()) * 5,
-            ),
+            _patch_token_counter(translator, lambda text: len(text.splitlines()) * 5),
             patch.object(translator, "_translate_chunk", side_effect=fake_translate),
             caplog.at_level("ERROR"),
         ):
@@ -429,7 +868,11 @@ class TestTranslator:
         failed_chunk_index = 2
 
         def fake_translate(
-            chunk_index: int, _chunk_text: str, _progress=None, _task_id=None
+            chunk_index: int,
+            _chunk_text: str,
+            _progress=None,
+            _task_id=None,
+            _input_tokens=None,
         ):
             # Fail on chunk 2, succeed on chunk 1
             if chunk_index == failed_chunk_index:
@@ -437,11 +880,7 @@ class TestTranslator:
             return f"success{chunk_index}"
 
         with (
-            patch.object(
-                translator.token_counter,
-                "count_tokens",
-                side_effect=lambda text: len(text.splitlines()) * 5,
-            ),
+            _patch_token_counter(translator, lambda text: len(text.splitlines()) * 5),
             patch.object(translator, "_translate_chunk", side_effect=fake_translate),
         ):
             metrics = translator.translate()
@@ -477,9 +916,7 @@ class TestBalancedChunkDistribution:
             except ValueError:
                 return 0
 
-        with patch.object(
-            translator.token_counter, "count_tokens", side_effect=count_tokens_mock
-        ):
+        with _patch_token_counter(translator, count_tokens_mock):
             chunks = list(translator.chunk_generator(lines))
 
         # Should create 2 chunks with balanced distribution
@@ -530,10 +967,9 @@ class TestBalancedChunkDistribution:
 
         lines = ["line1\n", "line2\n", "line3\n"]
 
-        with patch.object(
-            translator.token_counter,
-            "count_tokens",
-            side_effect=lambda text: len(text.splitlines()) * 1000,  # 3000 total
+        # 3000 tokens total
+        with _patch_token_counter(
+            translator, lambda text: len(text.splitlines()) * 1000
         ):
             chunks = list(translator.chunk_generator(lines))
 
@@ -562,11 +998,7 @@ class TestBalancedChunkDistribution:
             return len(text.splitlines()) * 100
 
         with (
-            patch.object(
-                translator.token_counter,
-                "count_tokens",
-                side_effect=count_tokens_mock,
-            ),
+            _patch_token_counter(translator, count_tokens_mock),
             caplog.at_level("WARNING"),
         ):
             chunks = list(translator.chunk_generator(lines))
@@ -599,11 +1031,7 @@ class TestBalancedChunkDistribution:
             return len(text.splitlines()) * 2500  # Each normal line: 2500 tokens
 
         with (
-            patch.object(
-                translator.token_counter,
-                "count_tokens",
-                side_effect=count_tokens_mock,
-            ),
+            _patch_token_counter(translator, count_tokens_mock),
             caplog.at_level("WARNING"),
         ):
             chunks = list(translator.chunk_generator(lines))
@@ -645,10 +1073,8 @@ class TestBalancedChunkDistribution:
         # Simulate 45,000 tokens (should create 3 chunks of ~15,000 each)
         lines = [f"line{i}\n" for i in range(45)]
 
-        with patch.object(
-            translator.token_counter,
-            "count_tokens",
-            side_effect=lambda text: len(text.splitlines()) * 1000,
+        with _patch_token_counter(
+            translator, lambda text: len(text.splitlines()) * 1000
         ):
             chunks = list(translator.chunk_generator(lines))
 
@@ -688,9 +1114,7 @@ class TestBalancedChunkDistribution:
                     return token_counts[i]
             return sum(token_counts[i] for i, line in enumerate(lines) if line in text)
 
-        with patch.object(
-            translator.token_counter, "count_tokens", side_effect=count_tokens_mock
-        ):
+        with _patch_token_counter(translator, count_tokens_mock):
             chunks = list(translator.chunk_generator(lines))
 
         # Should NOT merge because 80+30=110 > 100
@@ -724,7 +1148,11 @@ class TestBalancedChunkDistribution:
         ]
 
         def fake_translate(
-            chunk_index: int, _chunk_text: str, _progress=None, _task_id=None
+            chunk_index: int,
+            _chunk_text: str,
+            _progress=None,
+            _task_id=None,
+            _input_tokens=None,
         ) -> str:
             return f"translated_chunk_{chunk_index}"
 
@@ -738,8 +1166,120 @@ class TestBalancedChunkDistribution:
 
         expected_calls = 2
         assert mocked.call_count == expected_calls
-        mocked.assert_any_call(1, "chunk1\n", ANY, ANY)
-        mocked.assert_any_call(2, "chunk2\nchunk3\n", ANY, ANY)
+        # Chunk token counts from chunking are passed through, not recounted
+        merged_tokens = 50
+        mocked.assert_any_call(1, "chunk1\n", ANY, ANY, 90)
+        mocked.assert_any_call(2, "chunk2\nchunk3\n", ANY, ANY, merged_tokens)
+
+    @pytest.mark.parametrize("max_workers", [1, 2])
+    def test_identical_chunks_are_translated_once(self, tmp_path, max_workers):
+        """Duplicate chunk text reuses the first translation in both modes."""
+        input_file = tmp_path / "input.txt"
+        output_file = tmp_path / "output.txt"
+        input_file.write_text("line1\n")
+
+        config = _build_config()
+        with (
+            patch(
+                "src.core.streaming_translator.TranslationConfig", return_value=config
+            ),
+            patch("src.core.streaming_translator.OpenAI"),
+        ):
+            translator = StreamingTranslator(
+                input_file=str(input_file),
+                output_file=str(output_file),
+                max_token_length=10,
+                max_workers=max_workers,
+            )
+
+        chunks = [
+            ("same\n", 10, False),
+            ("other\n", 10, False),
+            ("same\n", 10, False),
+        ]
+
+        def fake_translate(
+            chunk_index: int,
+            _chunk_text: str,
+            _progress=None,
+            _task_id=None,
+            _input_tokens=None,
+        ) -> str:
+            return f"translated_chunk_{chunk_index}"
+
+        with (
+            patch.object(translator, "_build_chunks", return_value=chunks),
+            patch.object(
+                translator, "_translate_chunk", side_effect=fake_translate
+            ) as mocked,
+        ):
+            result = translator.translate()
+
+        expected_calls = 2
+        expected_successes = 3
+        assert mocked.call_count == expected_calls
+        assert result.successes == expected_successes
+        assert output_file.read_text() == (
+            "  translated_chunk_1\n\n  translated_chunk_2\n\n  translated_chunk_1\n\n"
+        )
+
+    def test_completed_chunks_are_written_during_run(self, tmp_path):
+        """Earlier chunks reach the output file before later ones finish."""
+        input_file = tmp_path / "input.txt"
+        output_file = tmp_path / "output.txt"
+        input_file.write_text("line1\n")
+
+        config = _build_config()
+        with (
+            patch(
+                "src.core.streaming_translator.TranslationConfig", return_value=config
+            ),
+            patch("src.core.streaming_translator.OpenAI"),
+        ):
+            translator = StreamingTranslator(
+                input_file=str(input_file),
+                output_file=str(output_file),
+                max_token_length=10,
+                max_workers=1,
+            )
+
+        chunks = [("first\n", 10, False), ("second\n", 10, False)]
+        seen_before_second: list[str] = []
+
+        def fake_translate(
+            chunk_index: int,
+            _chunk_text: str,
+            _progress=None,
+            _task_id=None,
+            _input_tokens=None,
+        ) -> str:
+            if chunk_index == len(chunks):
+                seen_before_second.append(output_file.read_text())
+            return f"translated_chunk_{chunk_index}"
+
+        with (
+            patch.object(translator, "_build_chunks", return_value=chunks),
+            patch.object(translator, "_translate_chunk", side_effect=fake_translate),
+        ):
+            translator.translate()
+
+        assert seen_before_second == ["  translated_chunk_1\n\n"]
+        assert output_file.read_text() == (
+            "  translated_chunk_1\n\n  translated_chunk_2\n\n"
+        )
+
+    def test_ordered_writer_holds_results_until_predecessors_resolve(self):
+        """Out-of-order results are written only once every earlier chunk is
+        resolved, and failed chunks are skipped."""
+        output = io.StringIO()
+        writer = _OrderedChunkWriter(output, [1, 2, 3])
+
+        writer.resolve(3, "third")
+        writer.resolve(2, None)
+        assert output.getvalue() == ""
+
+        writer.resolve(1, "first")
+        assert output.getvalue() == "  first\n\n  third\n\n"
 
 
 # Trace: SPEC-REFACTOR-VALIDATION-001, TASK-20251228-REFACTOR-VALIDATION-001
@@ -855,73 +1395,73 @@ class TestProgressNoneHandling:
 class TestHelperMethods:
     """Tests for deduplicated helper methods."""
 
-    def test_write_translations_creates_file_with_utf8(self, tmp_path):
-        """AC-2: _write_translations() creates output file with UTF-8 encoding"""
-        config = _build_config()
-        with (
-            patch(
-                "src.core.streaming_translator.TranslationConfig", return_value=config
-            ),
-            patch("src.core.streaming_translator.OpenAI"),
-        ):
-            translator = StreamingTranslator(input_file="dummy")
-
+    def test_ordered_writer_creates_file_with_utf8(self, tmp_path):
+        """AC-2: The ordered writer produces a UTF-8 readable output file"""
         output_file = tmp_path / "output.txt"
-        results = {1: "첫 번째", 2: "두 번째"}
-        chunks = [(1, "chunk1"), (2, "chunk2")]
 
-        translator._write_translations(results, chunks, str(output_file))
+        _write_ordered(output_file, {1: "첫 번째", 2: "두 번째"}, [1, 2])
 
         # File should exist and be readable with UTF-8
         content = output_file.read_text(encoding="utf-8")
         assert "첫 번째" in content
         assert "두 번째" in content
 
-    def test_write_translations_correct_formatting(self, tmp_path):
-        """AC-1: _write_translations() writes with double newline between chunks"""
-        config = _build_config()
-        with (
-            patch(
-                "src.core.streaming_translator.TranslationConfig", return_value=config
-            ),
-            patch("src.core.streaming_translator.OpenAI"),
-        ):
-            translator = StreamingTranslator(input_file="dummy")
-
+    def test_ordered_writer_correct_formatting(self, tmp_path):
+        """AC-1: The ordered writer separates chunks with a blank line"""
         output_file = tmp_path / "output.txt"
-        results = {1: "first", 2: "second", 3: "third"}
-        chunks = [(1, "c1"), (2, "c2"), (3, "c3")]
 
-        translator._write_translations(results, chunks, str(output_file))
+        _write_ordered(output_file, {1: "first", 2: "second", 3: "third"}, [1, 2, 3])
 
         content = output_file.read_text(encoding="utf-8")
-        # Should have exactly 5 newlines: first\n\nsecond\n\nthird\n\n
-        # That's 3 chunks * 2 newlines each = 6 newlines total
-        assert content == "first\n\nsecond\n\nthird\n\n"
-
-    def test_write_translations_skips_missing_chunks(self, tmp_path):
-        """_write_translations() only writes chunks that were successfully translated"""
-        config = _build_config()
-        with (
-            patch(
-                "src.core.streaming_translator.TranslationConfig", return_value=config
-            ),
-            patch("src.core.streaming_translator.OpenAI"),
-        ):
-            translator = StreamingTranslator(input_file="dummy")
+        # 3 chunks * 2 newlines each = 6 newlines total
+        assert content == "  first\n\n  second\n\n  third\n\n"
 
+    def test_ordered_writer_skips_missing_chunks(self, tmp_path):
+        """The ordered writer only writes chunks that were translated"""
         output_file = tmp_path / "output.txt"
-        # Chunk 2 is missing (failed translation)
-        results = {1: "first", 3: "third"}
-        chunks = [(1, "c1"), (2, "c2"), (3, "c3")]
 
-        translator._write_translations(results, chunks, str(output_file))
+        # Chunk 2 is missing (failed translation)
+        _write_ordered(output_file, {1: "first", 3: "third"}, [1, 2, 3])
 
         content = output_file.read_text(encoding="utf-8")
         # Should only have chunks 1 and 3
-        assert content == "first\n\nthird\n\n"
+        assert content == "  first\n\n  third\n\n"
         assert "second" not in content
 
+    def test_ordered_writer_matches_format_output(self, tmp_path):
+        """The ordered writer's output is already what format_output produces"""
+        output_file = tmp_path / "output.txt"
+        results = {1: "제목\n\n  들여쓴 줄\n본문", 2: "  \n마지막"}
+
+        _write_ordered(output_file, results, [1, 2])
+        written = output_file.read_text(encoding="utf-8")
+        OutputFormatter.format_output(str(output_file))
+
+        assert written == "  제목\n\n  들여쓴 줄\n  본문\n\n  \n  마지막\n\n"
+        assert output_file.read_text(encoding="utf-8") == written
+
+    def test_format_text_normalizes_crlf_like_format_output(self, tmp_path):
+        """CRLF and lone CR line endings are normalized, as the old write then
+        format_output (text-mode read) path did"""
+        text = "제목\r\n본문\r마지막\r\n"
+        output_file = tmp_path / "output.txt"
+        output_file.write_bytes(text.encode("utf-8"))
+        OutputFormatter.format_output(str(output_file))
+
+        formatted = OutputFormatter.format_text(text)
+
+        assert formatted == "  제목\n  본문\n  마지막\n"
+        assert "\r" not in formatted
+        assert output_file.read_text(encoding="utf-8") == formatted
+
+    def test_ordered_writer_all_failed_writes_empty_file(self, tmp_path):
+        """The ordered writer leaves an empty file when no chunk succeeded"""
+        output_file = tmp_path / "output.txt"
+
+        _write_ordered(output_file, {}, [1])
+
+        assert output_file.read_text(encoding="utf-8") == ""
+
     def test_update_task_progress_success(self):
         """AC-3: _update_task_progress() marks success correctly"""
         config = _build_config()
@@ -1010,15 +1550,17 @@ class TestHelperMethods:
 
         # Mock translation to return deterministic results
         def fake_translate(
-            chunk_index: int, _chunk_text: str, _progress=None, _task_id=None
+            chunk_index: int,
+            _chunk_text: str,
+            _progress=None,
+            _task_id=None,
+            _input_tokens=None,
         ):
             return f"translated_chunk_{chunk_index}"
 
         with (
-            patch.object(
-                seq_translator.token_counter,
-                "count_tokens",
-                side_effect=lambda text: len(text.splitlines()) * 5,
+            _patch_token_counter(
+                seq_translator, lambda text: len(text.splitlines()) * 5
             ),
             patch.object(
                 seq_translator, "_translate_chunk", side_effect=fake_translate
@@ -1027,10 +1569,8 @@ class TestHelperMethods:
             seq_translator.translate()
 
         with (
-            patch.object(
-                par_translator.token_counter,
-                "count_tokens",
-                side_effect=lambda text: len(text.splitlines()) * 5,
+            _patch_token_counter(
+                par_translator, lambda text: len(text.splitlines()) * 5
             ),
             patch.object(
                 par_translator, "_translate_chunk", side_effect=fake_translate
@@ -0,0 +1,87 @@
+"""Tests for the request/token rate limiter."""
+
+from unittest.mock import patch
+
+import pytest
+
+from src.core.rate_limiter import RateLimiter
+
+
+class FakeClock:
+    """Monotonic clock whose sleep advances time instead of blocking."""
+
+    def __init__(self) -> None:
+        self.now = 0.0
+        self.sleeps: list[float] = []
+
+    def monotonic(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+@pytest.fixture
+def clock():
+    fake = FakeClock()
+    with (
+        patch("src.core.rate_limiter.time.monotonic", side_effect=fake.monotonic),
+        patch("src.core.rate_limiter.time.sleep", side_effect=fake.sleep),
+    ):
+        yield fake
+
+
+class TestRateLimiter:
+    def test_disabled_limiter_never_sleeps(self, clock):
+        """GIVEN no limits WHEN acquiring THEN returns immediately."""
+        limiter = RateLimiter()
+
+        for _ in range(100):
+            limiter.acquire(1_000_000)
+
+        assert not limiter.enabled
+        assert clock.sleeps == []
+
+    def test_request_limit_waits_for_refill(self, clock):
+        """GIVEN 60 RPM WHEN bucket is drained THEN next request waits ~1s."""
+        limiter = RateLimiter(max_requests_per_minute=60)
+
+        for _ in range(60):
+            limiter.acquire()
+        assert clock.sleeps == []
+
+        limiter.acquire()
+
+        assert clock.sleeps == [pytest.approx(1.0)]
+
+    def test_token_limit_waits_for_needed_tokens(self, clock):
+        """GIVEN 600 TPM WHEN tokens exhausted THEN wait scales with deficit."""
+        limiter = RateLimiter(max_tokens_per_minute=600)
+
+        limiter.acquire(600)
+        limiter.acquire(100)
+
+        # 100 tokens at 10 tokens/sec
+        assert clock.sleeps == [pytest.approx(10.0)]
+        assert limiter.available_token_capacity == pytest.approx(0.0)
+
+    def test_oversized_request_is_clamped_to_capacity(self, clock):
+        """GIVEN a request above TPM WHEN acquiring THEN it does not block
+        forever."""
+        limiter = RateLimiter(max_tokens_per_minute=100)
+
+        limiter.acquire(10_000)
+
+        assert clock.sleeps == []
+        assert limiter.available_token_capacity == pytest.approx(0.0)
+
+    def test_capacity_is_capped_at_one_minute(self, clock):
+        """GIVEN a long idle period WHEN refilling THEN capacity stays at limit."""
+        limiter = RateLimiter(max_requests_per_minute=10, max_tokens_per_minute=50)
+        clock.now += 3600
+
+        limiter.acquire(10)
+
+        assert limiter.available_request_capacity == pytest.approx(9.0)
+        assert limiter.available_token_capacity == pytest.approx(40.0)
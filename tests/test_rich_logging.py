@@ -43,6 +43,9 @@ def test_translate_uses_shared_console_and_transient_progress(tmp_path, monkeypa
 
     translator = StreamingTranslator(input_file=str(input_file), max_workers=1)
     monkeypatch.setattr(translator.token_counter, "count_tokens", lambda _text: 1)
+    monkeypatch.setattr(
+        translator.token_counter, "count_tokens_batch", lambda texts: [1] * len(texts)
+    )
 
     with patch("src.core.streaming_translator.Progress") as mock_progress:
         translator.translate()
@@ -1,6 +1,7 @@
 # GENERATED FROM SPEC-TOKEN-COUNTER-001
 
 import threading
+from unittest.mock import Mock, patch
 
 from src.utils.token_counter import TokenCounter
 
@@ -17,6 +18,11 @@ class TestTokenCounter:
         TokenCounter._instance = None
         TokenCounter._encoding = None
 
+    def teardown_method(self) -> None:
+        """Drop any singleton built here (possibly with a fake encoding)."""
+        TokenCounter._instance = None
+        TokenCounter._encoding = None
+
     # Trace: SPEC-TOKEN-COUNTER-001, TEST-TOKEN-COUNTER-001-AC1
     def test_singleton_returns_same_instance(self) -> None:
         """AC-1: GIVEN TokenCounter WHEN creating multiple instances THEN same
@@ -181,3 +187,50 @@ class TestTokenCounter:
         # Then
         assert count1 == count2
         assert counter1._encoding is counter2._encoding
+
+    def test_count_tokens_batch_matches_single_counts(self) -> None:
+        """GIVEN several texts WHEN counting in a batch THEN each count matches
+        count_tokens in input order."""
+        # Given
+        counter = TokenCounter()
+        texts = ["Hello world", "", "안녕하세요 世界", "The quick brown fox\n"]
+
+        # When
+        counts = counter.count_tokens_batch(texts)
+
+        # Then
+        assert counts == [counter.count_tokens(text) for text in texts]
+
+    def test_special_token_text_is_counted_as_plain_text(self) -> None:
+        """GIVEN text containing a special-token marker WHEN counting THEN it is
+        tokenized as ordinary text instead of raising."""
+        # Given
+        counter = TokenCounter()
+        text = "literal <|endoftext|> marker"
+
+        # When
+        count = counter.count_tokens(text)
+
+        # Then
+        assert count > 1
+        assert counter.count_tokens_batch([text]) == [count]
+
+    def test_count_tokens_batch_encodes_repeated_texts_once(self) -> None:
+        """GIVEN repeated lines WHEN counting in a batch THEN each distinct
+        text is encoded once and counts keep the input order."""
+        # Given
+        encoding = Mock()
+        encoding.encode_ordinary_batch.side_effect = lambda texts: [
+            [0] * len(text) for text in texts
+        ]
+        with patch(
+            "src.utils.token_counter.tiktoken.get_encoding", return_value=encoding
+        ):
+            counter = TokenCounter()
+
+        # When
+        counts = counter.count_tokens_batch(["\n", "abc", "\n", "abc", "de"])
+
+        # Then
+        assert counts == [1, 3, 1, 3, 2]
+        encoding.encode_ordinary_batch.assert_called_once_with(["\n", "abc", "de"])
@@ -0,0 +1,104 @@
+"""Tests for the persistent translation cache."""
+
+from src.core.translation_cache import TranslationCache
+
+
+class TestTranslationCache:
+    def test_disabled_cache_never_hits_or_writes(self, tmp_path):
+        """GIVEN no cache path WHEN storing THEN nothing is kept or written."""
+        cache = TranslationCache(None, model="m", temperature=0.0)
+        key = cache.key("prompt")
+
+        cache.put(key, "번역")
+
+        assert not cache.enabled
+        assert cache.get(key) is None
+        assert list(tmp_path.iterdir()) == []
+
+    def test_entries_survive_reload(self, tmp_path):
+        """GIVEN stored translations WHEN reopening the file THEN they hit."""
+        path = tmp_path / "cache.jsonl"
+        cache = TranslationCache(str(path), model="m", temperature=0.0)
+        key = cache.key("prompt")
+        cache.put(key, "번역")
+
+        reloaded = TranslationCache(str(path), model="m", temperature=0.0)
+
+        assert reloaded.get(key) == "번역"
+        assert "번역" in path.read_text(encoding="utf-8")
+
+    def test_key_depends_on_model_temperature_and_prompt(self):
+        """GIVEN different request settings WHEN hashing THEN keys differ."""
+        base = TranslationCache(None, model="m", temperature=0.0)
+        other_model = TranslationCache(None, model="n", temperature=0.0)
+        other_temperature = TranslationCache(None, model="m", temperature=0.5)
+
+        keys = {
+            base.key("prompt"),
+            base.key("prompt2"),
+            other_model.key("prompt"),
+            other_temperature.key("prompt"),
+        }
+
+        expected_unique_keys = 4
+        assert len(keys) == expected_unique_keys
+        assert base.key("prompt") == base.key("prompt")
+
+    def test_torn_last_line_is_skipped_and_not_extended(self, tmp_path):
+        """GIVEN a file ending in a partial record WHEN loading and appending
+        THEN the partial line is ignored and the new entry stays readable."""
+        path = tmp_path / "cache.jsonl"
+        cache = TranslationCache(str(path), model="m", temperature=0.0)
+        cache.put(cache.key("a"), "first")
+        with path.open("a", encoding="utf-8") as file:
+            file.write('{"key": "torn", "transl')
+
+        reopened = TranslationCache(str(path), model="m", temperature=0.0)
+        reopened.put(reopened.key("b"), "second")
+        reloaded = TranslationCache(str(path), model="m", temperature=0.0)
+
+        expected_entries = 2
+        assert len(reloaded) == expected_entries
+        assert reloaded.get(reloaded.key("a")) == "first"
+        assert reloaded.get(reloaded.key("b")) == "second"
+
+    def test_missing_parent_directory_is_created(self, tmp_path):
+        """GIVEN a path in a missing directory WHEN storing THEN it is created."""
+        path = tmp_path / "nested" / "cache.jsonl"
+        cache = TranslationCache(str(path), model="m", temperature=0.0)
+
+        cache.put(cache.key("a"), "first")
+
+        assert cache.enabled
+        assert "first" in path.read_text(encoding="utf-8")
+
+    def test_unwritable_path_disables_cache_without_raising(self, tmp_path, caplog):
+        """GIVEN a path whose parent is a file WHEN storing THEN nothing raises,
+        a warning is logged and the cache is disabled."""
+        blocker = tmp_path / "not_a_directory"
+        blocker.write_text("", encoding="utf-8")
+        cache = TranslationCache(
+            str(blocker / "cache.jsonl"), model="m", temperature=0.0
+        )
+
+        cache.put(cache.key("a"), "first")
+
+        assert not cache.enabled
+        assert cache.get(cache.key("a")) is None
+        assert any("disabled" in message for message in caplog.messages)
+
+    def test_failed_append_disables_cache_without_raising(self, tmp_path, caplog):
+        """GIVEN the cache directory vanishes mid-run WHEN storing THEN the
+        append failure is logged and later entries are not attempted."""
+        directory = tmp_path / "cache_dir"
+        cache = TranslationCache(
+            str(directory / "cache.jsonl"), model="m", temperature=0.0
+        )
+        directory.rmdir()
+
+        cache.put(cache.key("a"), "first")
+        cache.put(cache.key("b"), "second")
+
+        assert not cache.enabled
+        assert len([m for m in caplog.messages if "write failed" in m]) == 1
+        assert not directory.exists()
@@ -3,6 +3,8 @@
 
 import importlib
 import json
+import os
+from unittest.mock import patch
 
 import pytest
 
@@ -110,6 +112,95 @@ class TestTranslationConfig:
 
     def test_prompt_requires_translation_only_output(self):
         """AC-5: prompt instructs to output only translated text without source."""
-        template = TranslationConfig.PROMPT_TEMPLATE
+        template = TranslationConfig.SYSTEM_PROMPT_TEMPLATE
         assert "Output only the translated text" in template
         assert "do not repeat the source text" in template
+
+    def test_build_messages_keeps_static_system_prompt(self, tmp_path):
+        """AC-6: instructions and glossary form a fixed system message; only
+        the user message carries the chunk text."""
+        glossary_file = tmp_path / "glossary.json"
+        glossary_file.write_text(
+            json.dumps([{"term": "AI", "translation": "인공지능"}]), encoding="utf-8"
+        )
+        config = TranslationConfig(glossary_path=str(glossary_file))
+        text = "Results {not a field} and 100% recall\n"
+
+        first = config.build_messages(text)
+        second = config.build_messages("other chunk")
+
+        assert first == [
+            {
+                "role": "system",
+                "content": TranslationConfig.SYSTEM_PROMPT_TEMPLATE.format(
+                    glossary="- AI > 인공지능"
+                ),
+            },
+            {"role": "user", "content": text},
+        ]
+        assert first[0] == second[0]
+
+    def test_glossary_cached_until_file_changes(self, tmp_path):
+        """AC-7: unchanged glossary is parsed once; edits are picked up."""
+        glossary_file = tmp_path / "glossary.json"
+        glossary_file.write_text(
+            json.dumps([{"term": "AI", "translation": "인공지능"}]), encoding="utf-8"
+        )
+
+        with patch(
+            "src.core.translation_config.json.load", side_effect=json.load
+        ) as mock_load:
+            first = TranslationConfig(glossary_path=str(glossary_file))
+            second = TranslationConfig(glossary_path=str(glossary_file))
+
+            assert mock_load.call_count == 1
+            assert first.glossary == second.glossary == "- AI > 인공지능"
+
+            glossary_file.write_text(
+                json.dumps([{"term": "ML", "translation": "기계학습"}]),
+                encoding="utf-8",
+            )
+            stat = glossary_file.stat()
+            os.utime(glossary_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1))
+            updated = TranslationConfig(glossary_path=str(glossary_file))
+
+        expected_loads = 2
+        assert mock_load.call_count == expected_loads
+        assert updated.glossary == "- ML > 기계학습"
+
+    def test_glossary_cache_shared_across_relative_and_absolute_paths(
+        self, tmp_path, monkeypatch
+    ):
+        """The same glossary file reached by two spellings is parsed once."""
+        glossary_file = tmp_path / "glossary.json"
+        glossary_file.write_text(
+            json.dumps([{"term": "AI", "translation": "인공지능"}]), encoding="utf-8"
+        )
+        monkeypatch.chdir(tmp_path)
+
+        with patch(
+            "src.core.translation_config.json.load", side_effect=json.load
+        ) as mock_load:
+            TranslationConfig(glossary_path=str(glossary_file))
+            TranslationConfig(glossary_path="glossary.json")
+
+        assert mock_load.call_count == 1
+
+    def test_glossary_rewrite_with_same_mtime_is_picked_up(self, tmp_path):
+        """A rewrite within the same mtime tick is detected by its size."""
+        glossary_file = tmp_path / "glossary.json"
+        glossary_file.write_text(
+            json.dumps([{"term": "AI", "translation": "인공지능"}]), encoding="utf-8"
+        )
+        original = glossary_file.stat()
+        first = TranslationConfig(glossary_path=str(glossary_file))
+
+        glossary_file.write_text(
+            json.dumps([{"term": "LLM", "translation": "대규모 언어 모델"}]),
+            encoding="utf-8",
+        )
+        os.utime(glossary_file, ns=(original.st_atime_ns, original.st_mtime_ns))
+        updated = TranslationConfig(glossary_path=str(glossary_file))
+
+        assert first.glossary == "- AI > 인공지능"
+        assert updated.glossary == "- LLM > 대규모 언어 모델"